@@ -1,25 +1,28 @@
-# pybricks blocks file:{"blocks":{"languageVersion":0,"blocks":[{"type":"blockGlobalSetup","id":"bjK,wS1MYO7aiYkFSwd{","x":143,"y":33,"deletable":false,"next":{"block":{"type":"variables_set_motor","id":"d8I3NC/~/Bd|JB=./IYI","fields":{"VAR":{"id":"J?}q![eYC]S.)}0EIHQ-"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"NJ9e)#7+uOY7+#ba7~-c","fields":{"NAME":"C"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"1|/:FcFe4/{JG!]dx.`z","fields":{"SELECTION":"Direction.CLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"!{aZHs|:76`}@xu[@*[(","fields":{"VAR":{"id":"_{%Sf|7eh8`AN@m.1i*P"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"xNY3xGxfrII^@z6P}%dd","fields":{"NAME":"A"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"8I*f(++dw~YqGRBDzO~^","fields":{"SELECTION":"Direction.COUNTERCLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"@AcnA{)AYJ8|ec|1u^B3","fields":{"VAR":{"id":"vo%33gv|?(#@]@v?]I{3"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"3;i5B%I`^X4q$Hki3;5V","fields":{"NAME":"B"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"?~xgRJ^iYM8V=pkY1N*5","fields":{"SELECTION":"Direction.COUNTERCLOCKWISE"}}}},"next":{"block":{"type":"variables_set_drive_base","id":"}+VZKywZ`p=8?yi:GFV(","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M"}},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"/KVvz;C;`+^D2ca~7c(j","fields":{"VAR":{"id":"_{%Sf|7eh8`AN@m.1i*P","name":"left","type":"Motor"}}}},"VAR2":{"shadow":{"type":"variables_get_motor_device","id":"VWb?bKKD$2Ic_c90BX`0","fields":{"VAR":{"id":"J?}q![eYC]S.)}0EIHQ-","name":"right","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_distance","id":";r6!/wo1)$bmOgj}at)d","fields":{"VALUE0":56}}},"VALUE1":{"shadow":{"type":"unit_distance","id":"+_d@.!aphLEZd5.|I]|!","fields":{"VALUE0":98}}}}}}}}}}}}},{"type":"blockGlobalStart","id":"3tJe|AWl0baN(wH9a$@.","x":140,"y":393,"deletable":false,"next":{"block":{"type":"blockDriveBaseUseGyro","id":"A1EZ3pPmp12v)HX{SMpN","fields":{"METHOD":"DRIVEBASE_USE_GYRO_TRUE"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"`vAss9E9K:^.8l3BL9J2","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}}},"next":{"block":{"type":"blockDriveBaseConfigure","id":"CqU}]239#rE?+P^TWa4J","extraState":{"optionLevel":1},"fields":{"METHOD":"DRIVEBASE_STRAIGHT_SPEED"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"(`_KHh+[.iq6{ZD{x4oD","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_speed","id":"BB,ILPHXq:=_1lNg6vxJ","fields":{"VALUE0":300}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"@tNVO88%39j}L-D`3z{e","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"K(HmGZpl=J]#2J337fhC","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"%N#4*}|H89[uXGW0)thF","fields":{"VALUE0":-40}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"opdMn2RC=1kTVQ`WcDBn","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"B{~GRrg5epH#lq@{^s9?","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"x%-4@D`3^4Mnt-+]FZY^","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"iOx1,)hQo)E{U13^^Sl6","fields":{"VALUE0":250}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"rf{9y%s3h5cVjJYW?f0C","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"LHlR2-l4@!]{z9#U%xCq","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"Wm4C6umH1Gm+rf/[r^Cw","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"+54LaF9KO3mVX@.I@A6n","fields":{"VALUE0":40}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"ij$~ALHTigW{FmZugt8!","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"gZKmkW*YFeC|wd%:Kb=x","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"g^8-HH0T_sDJgvZ3Dc!!","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"46D^EJ@ls_VO;pS;Deq3","fields":{"VALUE0":550}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"x(6ZIMchK^8Ju2p}Th5x","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"v0_EV#Djz.@V,#+2@rCc","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":")g:FR~;=DCl;rG=4+c.U","fields":{"VAR":{"id":"vo%33gv|?(#@]@v?]I{3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"9^OYNCSNUT52eC=tn_S-","fields":{"VALUE0":300}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"cx#2TAuXe/-E3Z!cP3q2","fields":{"VALUE0":180}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"wQ{^~NK6G[_c=R#2{YEY","fields":{"VALUE":"Stop.BRAKE"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"IiW0%u{RT6Mu%yQoeg9Q","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"`)tw{kaB;l%1P8|6`/el","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"Y[SlVX7@he|c7`]*3Omu","fields":{"VALUE0":-45}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"]QZ}_d}F!VSZ245}Ei^/","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"c_P.dE~nVnVX-A_CiRqN","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"[Y)^_Hr4jhFzo$9sv%Mc","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"y81+Gwd/pzZ;@Hzds4AO","fields":{"VALUE0":150}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"[Kuo@hYnHHOTA;)|H|f:","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"vB{yI3{7uXzTAx())K.Y","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"!)Mq8^/0))WM;Ck9wf3#","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"Jq9^?!:v$EzPy][GNu#:","fields":{"VALUE0":-130}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"[K;hUws*yJtw0zJzkXXA","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"T{S`ZUv4S}#GY]Mea~3u","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"+RF^Iw1W]tjs#7j:|hvm","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"bhKVm67Y{mf@=c+UfhGI","fields":{"VALUE0":45}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"TkI;,(I#1o-Xy2o]HWM0","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"P2YrtkGDy*=ERz+g?u}]","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"jY5tQ`;tl-5RtN3Bxs(6","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"rm=EioCml[O}:O^.A7=h","fields":{"VALUE0":-700}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"%VjT9SONa#E4CNxB=h~z","fields":{"VALUE":"Stop.HOLD"}}}}}}}}}}}}}}}}}}}}}}}}}}}}},{"type":"blockDriveBaseDrive2","id":"oO[VliIH-910g6X:Ee{R","x":168,"y":1111,"enabled":false,"extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"{f/)T7roA?:|/N4BL8Du","fields":{"VAR":{"id":"P*clZHD?MSLt+xE-q5#M","name":"robot","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"5Q.!-1g8VwBwkAP||`u;","fields":{"VALUE0":745}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"f~]Iux?HFGKQZ)o/rej(","fields":{"VALUE":"Stop.HOLD"}}}}}]},"variables":[{"name":"red","id":"Ff@7eog?bf[4HYjstE++","type":"ColorDef"},{"name":"orange","id":"~@):WC)S0|iG3hGP|Rk%","type":"ColorDef"},{"name":"yellow","id":"E$4K=^:J`sA?vP-G4ilN","type":"ColorDef"},{"name":"green","id":"]HLBP~$rMRP=0imIFv.X","type":"ColorDef"},{"name":"cyan","id":"9Cug#cz7`v5o!v1#{K?J","type":"ColorDef"},{"name":"blue","id":"AAX$R.S7XH2JRG,].vL!","type":"ColorDef"},{"name":"violet","id":"i5~Y{G6j[C#{PuY,c;6%","type":"ColorDef"},{"name":"magenta","id":"U9AcV91+7SG-!;1L-d.t","type":"ColorDef"},{"name":"white","id":"XG?~~:^yK},/5SRSuU,]","type":"ColorDef"},{"name":"none","id":"G7Y8$o:Md@YC,pfrAgi_","type":"ColorDef"},{"name":"robot","id":"P*clZHD?MSLt+xE-q5#M","type":"DriveBase"},{"name":"left","id":"_{%Sf|7eh8`AN@m.1i*P","type":"Motor"},{"name":"right","id":"J?}q![eYC]S.)}0EIHQ-","type":"Motor"},{"name":"left gear","id":"vo%33gv|?(#@]@v?]I{3","type":"Motor"}],"info":{"type":"pybricks","version":"1.3.2"}}
-from pybricks.parameters import Direction, Port, Stop
-from pybricks.pupdevices import Motor
-from pybricks.robotics import DriveBase
+from pybricks.parameters import Stop
 
-# Set up all devices.
-right = Motor(Port.C, Direction.CLOCKWISE)
-left = Motor(Port.A, Direction.COUNTERCLOCKWISE)
-left_gear = Motor(Port.B, Direction.COUNTERCLOCKWISE)
-robot = DriveBase(left, right, 56, 98)
+from engine import LEFT_GEAR, RUN_ANGLE, SETTINGS, STRAIGHT, TURN, run
+from runtime import launch
+
+
+MISSION_1_2 = (
+    (SETTINGS, 300),
+    (TURN, -40),
+    (STRAIGHT, 250),
+    (TURN, 40),
+    (STRAIGHT, 550),
+    (RUN_ANGLE, LEFT_GEAR, 300, -180, Stop.BRAKE),
+    (TURN, -45),
+    (STRAIGHT, 150),
+    (STRAIGHT, -130),
+    (TURN, 45),
+    (STRAIGHT, -700),
+)
+
+
+def mission_1_2():
+    run(MISSION_1_2)
 
 
 # The main program starts here.
-robot.use_gyro(True)
-robot.settings(straight_speed=300)
-robot.turn(-40)
-robot.straight(250)
-robot.turn(40)
-robot.straight(550)
-left_gear.run_angle(300, 180, Stop.BRAKE)
-robot.turn(-45)
-robot.straight(150)
-robot.straight(-130)
-robot.turn(45)
-robot.straight(-700)
+if __name__ == "__main__":
+    launch(mission_1_2)
@@ -1,31 +1,34 @@
-# pybricks blocks file:{"blocks":{"languageVersion":0,"blocks":[{"type":"blockGlobalSetup","id":"bjK,wS1MYO7aiYkFSwd{","x":150,"y":100,"deletable":false,"next":{"block":{"type":"variables_set_prime_hub","id":"*bzKrE}s;lK[g!Tu4tuR","extraState":{"optionLevel":0},"fields":{"VAR":{"id":"%%e36iY!z7/:l@H=(Pc?"}},"next":{"block":{"type":"variables_set_motor","id":"/suJyHi`9{M.ew}Df$K9","fields":{"VAR":{"id":"4#tgdze;q)iNSj=s~C@="}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"U]R,gW,omdnh{w$yEfyX","fields":{"NAME":"C"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"Uc;$/xe_E;zIQ@^Irg]f","fields":{"SELECTION":"Direction.CLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"b5siUGrGhDBR?n]RbN]S","fields":{"VAR":{"id":"^6Jn;T;PS5ypD1$w1U[-"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":";E-5j6u/]1dt%I3,MaXk","fields":{"NAME":"A"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"4NvbUp2_EL_8RfIS{KAc","fields":{"SELECTION":"Direction.COUNTERCLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"h8~J4cq*rgk1N3aW$O5w","fields":{"VAR":{"id":"y3G|WaWPyKQIWX_cA)j2"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":".Gm$s|AxF_T$WBAyft1;","fields":{"NAME":"B"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"w(W:He}Inh|U9R8MhRH8","fields":{"SELECTION":"Direction.CLOCKWISE"}}}},"next":{"block":{"type":"variables_set_drive_base","id":"#mW9^2{5CnF]iQ3nzCd1","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s"}},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":")21U/Lb4KGcDn(uzLz]D","fields":{"VAR":{"id":"^6Jn;T;PS5ypD1$w1U[-","name":"left-wheel","type":"Motor"}}}},"VAR2":{"shadow":{"type":"variables_get_motor_device","id":",p5C@dK^Mwv-sFi7WWs5","fields":{"VAR":{"id":"4#tgdze;q)iNSj=s~C@=","name":"right-wheel","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_distance","id":"7e%?VT{#F)*@T*[.JpUq","fields":{"VALUE0":56}}},"VALUE1":{"shadow":{"type":"unit_distance","id":"c=/~}IFn!E1;Y.p|D=E1","fields":{"VALUE0":80}}}}}}}}}}}}}}},{"type":"blockGlobalStart","id":"3tJe|AWl0baN(wH9a$@.","x":165,"y":530,"deletable":false,"next":{"block":{"type":"blockDriveBaseUseGyro","id":"XBhD4!-58DeKw?a!*yXN","fields":{"METHOD":"DRIVEBASE_USE_GYRO_TRUE"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"D~IcDmgmEWD([s(N0fU.","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}}},"next":{"block":{"type":"blockComment","id":"Z*.CM{cDyy{um`Viji{H","fields":{"FIELDNAME":"Pull"},"next":{"block":{"type":"blockDriveBaseDrive2","id":"=Kqp1bMtgQYT]`~$N]?l","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"pT6nonrQU=$:Z{z4~0FT","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"4I3MOvZg$f)23[cS61K^","fields":{"VALUE0":62}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"Y2m6i)z420E%efKl@O[x","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"F(lbi~eOm,j|/5Khd^bL","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"z5pFH2:D?+W}E5}M+.)7","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"[IBd8pDU.FNEIK(LMt/^","fields":{"VALUE0":90}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"@^%5gUH9-ZRkRpoK3p(z","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"7n(xKm^XD*E@XrX%,7wC","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"EgD:JBlm.!olV3MXUlAN","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"EkvV;Ooha[0+qLfJyGlq","fields":{"VALUE0":260}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"|vLIBY9u4D5U4gP0iG7o","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"+}q[g[kwGMjF.ZF~:}9j","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"Qsey;-.U,mH[wbFROe1f","fields":{"VAR":{"id":"y3G|WaWPyKQIWX_cA)j2","name":"left-gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"Zg*cC@RZinchy?P+W=PP","fields":{"VALUE0":300}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"+L+I@$G2(3qN.o*KY;Xv","fields":{"VALUE0":450}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"V(vaioivuX)~F@Jy[8i*","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseConfigure","id":"BcxNkILW/$e##Gsy`_H[","extraState":{"optionLevel":1},"fields":{"METHOD":"DRIVEBASE_STRAIGHT_SPEED"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"N0^ZZJiB#u`{lmshzaH)","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_speed","id":"X8YQub0L2^b6UH5R63nf","fields":{"VALUE0":300}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"?ZU?SJg.R+Lx_|T}LE[O","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"KAgk:4:ebKkzEqdekm:=","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"#kKSC{Pm}W@07SK5E^Zo","fields":{"VALUE0":-125}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"i:U)RKLoMUq9|2}f%Kf-","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"5/Tl,H3J7,CEP6N=$#^v","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"pSFCu$ZxrLoWT.(rDprs","fields":{"VAR":{"id":"y3G|WaWPyKQIWX_cA)j2","name":"left-gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"1]YP);|{U+,A,-%0qCOD","fields":{"VALUE0":300}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"D$sv~uBt#3qI2uj11z!+","fields":{"VALUE0":-425}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"uaJcWolpU:G_%/!E1%|^","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"|TnF-,GFktOMj+F#^msm","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"~JZ^chmfh`sytr}6-%K`","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"=xL%.F;l-:joN6k2LE(!","fields":{"VALUE0":-90}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":",^8lX29W0z8z%+?m4qgZ","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"vMUM|gWL5/+T@3JpA:7i","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"BF$nIkr|6*NUNZf8`{Yu","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"Pb[NQA@XHqx^l`-)ZDqH","fields":{"VALUE0":145}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"woo?FYoSeUgur2-Hlzxj","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"e$_t!H{h6^Ak))gdW:=z","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"2(Cb?pi{@{=L=%FGs5lt","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"-%QtUH`Fund*Fwt6;NZk","fields":{"VALUE0":90}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"mO?JGHve`y~/4AJCgp*9","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockComment","id":")G1O#:o~pT-SX!r4mi`[","fields":{"FIELDNAME":"Push"},"next":{"block":{"type":"blockDriveBaseConfigure","id":"n75#?C%(t[GNyDCg@jiW","extraState":{"optionLevel":1},"fields":{"METHOD":"DRIVEBASE_STRAIGHT_SPEED"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"q@OY~E@+:@*lXnm;$7:?","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_speed","id":"T*Zj^U#d)OORHC.KLWsy","fields":{"VALUE0":220}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"zHt6b#1{E0vt,SYu[9JP","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"_{a?n*YJj?Z}@ZC9Hj99","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"20HZodPCMXyFV@]0Dt_t","fields":{"VALUE0":370}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"^38[A5))Qt~3Q_geUX_b","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"X/2(W2BBwOFr]Cb4SE=,","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"Vj%9?z-@[G85]_Z~{.qI","fields":{"VAR":{"id":"6F{O8aS=C!t?xc@#ib^s","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"r(S1Pc7y5DCThey%S~4h","fields":{"VALUE0":-600}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"qla1zcNigD:fd+3uN{hu","fields":{"VALUE":"Stop.HOLD"}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}},{"type":"blockMotorRun","id":"gm:g?D1AhKuiFF9-ay,N","x":440,"y":445,"enabled":false,"extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"Iv_D2hsQ}8H7#cI(rsjd","fields":{"VAR":{"id":"y3G|WaWPyKQIWX_cA)j2","name":"left-gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"g8U3Vi/N?AONd8Td=5MN","fields":{"VALUE0":300}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"ZQ;Er}yKD]mm)9x{*|@v","fields":{"VALUE0":-400}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":")dbbmphm^-8.~H~2T]`V","fields":{"VALUE":"Stop.HOLD"}}}}},{"type":"blockMotorRun","id":"y5x01fZ+LcaT*^Rar[0d","x":543,"y":561,"enabled":false,"extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"tAb-k_jyS=_-)OdJCezy","fields":{"VAR":{"id":"y3G|WaWPyKQIWX_cA)j2","name":"left-gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"Kn(,6XSXwrWwS*L?J(ut","fields":{"VALUE0":300}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"7o%%6o#KO{5iOtscJd+|","fields":{"VALUE0":40}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"[DcnB5ndVZNon%!yyG7r","fields":{"VALUE":"Stop.HOLD"}}}}}]},"variables":[{"name":"red","id":"mzq~@/K4tm8-qEe2,hDt","type":"ColorDef"},{"name":"orange","id":"_u.5,ogTG7~DqX$z}kD!","type":"ColorDef"},{"name":"yellow","id":":`+^XY6$du(OXEKJk[`+","type":"ColorDef"},{"name":"green","id":"jgsQBv/b3V+t`3Ua}D_:","type":"ColorDef"},{"name":"cyan","id":"^66j#/]r_XljZ$1)Uo6`","type":"ColorDef"},{"name":"blue","id":"8VG2:9(Le@UI^/?Z*P?Q","type":"ColorDef"},{"name":"violet","id":"#6dXw.oT:/$xm$n`ZVwa","type":"ColorDef"},{"name":"magenta","id":"DG%.rk?jH@*2UiaDcqw]","type":"ColorDef"},{"name":"white","id":"j]tzsl8JLqcU._z6(,#-","type":"ColorDef"},{"name":"none","id":"e(4bWgN2NaWk+[z~RM{l","type":"ColorDef"},{"name":"prime hub","id":"%%e36iY!z7/:l@H=(Pc?","type":"PrimeHub"},{"name":"drive base","id":"6F{O8aS=C!t?xc@#ib^s","type":"DriveBase"},{"name":"left-wheel","id":"^6Jn;T;PS5ypD1$w1U[-","type":"Motor"},{"name":"left-gear","id":"y3G|WaWPyKQIWX_cA)j2","type":"Motor"},{"name":"right-wheel","id":"4#tgdze;q)iNSj=s~C@=","type":"Motor"}],"info":{"type":"pybricks","version":"1.3.2"}}
-from pybricks.hubs import PrimeHub
-from pybricks.parameters import Direction, Port, Stop
-from pybricks.pupdevices import Motor
-from pybricks.robotics import DriveBase
+from engine import (FINISH, LEFT_GEAR, RUN_ANGLE, SETTINGS, START, STRAIGHT,
+                    TURN, run)
+from runtime import launch
 
-# Set up all devices.
-prime_hub = PrimeHub()
-right_wheel = Motor(Port.C, Direction.CLOCKWISE)
-left_wheel = Motor(Port.A, Direction.COUNTERCLOCKWISE)
-left_gear = Motor(Port.B, Direction.CLOCKWISE)
-drive_base = DriveBase(left_wheel, right_wheel, 56, 80)
+
+MISSION_12 = (
+    # Pull
+    (STRAIGHT, 62),
+    (TURN, 90),
+    (STRAIGHT, 260),
+    (RUN_ANGLE, LEFT_GEAR, 300, 450),
+    (SETTINGS, 300),
+    (STRAIGHT, -125),
+    # Lower the arm while driving to the push.
+    (START, LEFT_GEAR, 300, -425),
+    (TURN, -90),
+    (STRAIGHT, 145),
+    (TURN, 90),
+    # The arm must be down before the push.
+    (FINISH, LEFT_GEAR),
+    # Push
+    (SETTINGS, 220),
+    (STRAIGHT, 370),
+    (STRAIGHT, -600),
+)
+
+
+def mission_12():
+    run(MISSION_12)
 
 
 # The main program starts here.
-drive_base.use_gyro(True)
-# Pull
-drive_base.straight(62)
-drive_base.turn(90)
-drive_base.straight(260)
-left_gear.run_angle(300, 450)
-drive_base.settings(straight_speed=300)
-drive_base.straight(-125)
-left_gear.run_angle(300, -425)
-drive_base.turn(-90)
-drive_base.straight(145)
-drive_base.turn(90)
-# Push
-drive_base.settings(straight_speed=220)
-drive_base.straight(370)
-drive_base.straight(-600)
+if __name__ == "__main__":
+    launch(mission_12)
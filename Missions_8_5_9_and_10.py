@@ -1,57 +1,73 @@
-# pybricks blocks file:{"blocks":{"languageVersion":0,"blocks":[{"type":"blockGlobalSetup","id":"bjK,wS1MYO7aiYkFSwd{","x":63,"y":-19,"deletable":false,"next":{"block":{"type":"variables_set_prime_hub","id":"TOr[Y*p6lW/mk5ydzJ#@","extraState":{"optionLevel":0},"fields":{"VAR":{"id":"sNUcHq,4GbT0i33*%t,)"}},"next":{"block":{"type":"variables_set_motor","id":"J!fB%D37_bqds/yFx|Fk","fields":{"VAR":{"id":"`#(M;o4ZYJq8tDB[iZ?C"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"E:Toyf{|mW=_v|M,+o#=","fields":{"NAME":"C"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"mD8,(?-*+k8i0TKR]l,I","fields":{"SELECTION":"Direction.CLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"c!**t.gxCHJ4LNA!#hV{","fields":{"VAR":{"id":"Lb2},;H,NK3nY.@}-|9Z"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"oq$BVRUy8pUk+ulh#f7t","fields":{"NAME":"A"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"-(#8@OYHXhZt3^%G%PpB","fields":{"SELECTION":"Direction.COUNTERCLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"I;4yUi/,t,,__sRwxa-y","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"D0(|}9QKM$)zV@z|qc6U","fields":{"NAME":"B"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"4~-/nZ)^|$H6@g7oUJNA","fields":{"SELECTION":"Direction.CLOCKWISE"}}}},"next":{"block":{"type":"variables_set_drive_base","id":"(x=A|9k8X4?x9gd`kQFd","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??"}},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"+Z3N6A:Gsmr:4{_=e~.A","fields":{"VAR":{"id":"Lb2},;H,NK3nY.@}-|9Z","name":"left","type":"Motor"}}}},"VAR2":{"shadow":{"type":"variables_get_motor_device","id":"_`b.pWp2?1y,=*gjul:v","fields":{"VAR":{"id":"`#(M;o4ZYJq8tDB[iZ?C","name":"right","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_distance","id":"jvAHBV:=ex69.!zu)Qk#","fields":{"VALUE0":56}}},"VALUE1":{"shadow":{"type":"unit_distance","id":"U]{pA$:ON}LxCi8cKzrc","fields":{"VALUE0":80}}}}}}}}}}}}}}},{"type":"blockGlobalStart","id":"3tJe|AWl0baN(wH9a$@.","x":-76,"y":338,"deletable":false,"next":{"block":{"type":"blockDriveBaseUseGyro","id":"(:DT/*A7MqXWi;p9Y~~E","fields":{"METHOD":"DRIVEBASE_USE_GYRO_TRUE"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"0hc#EhoI8T}JNPV9P?^1","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}}},"next":{"block":{"type":"blockDriveBaseResetWithValues","id":"uy{47KXe?jUIt[+H?^Yx","inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"CmZEWY,qv)5~=qh@pJc8","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"VALUE0":{"shadow":{"type":"unit_distance","id":"){g;?4c#g8_O]n5Lf]LZ","fields":{"VALUE0":0}}},"VALUE1":{"shadow":{"type":"unit_angle","id":"YQI[!)JwMTj;`)S1%;Iy","fields":{"VALUE0":0}}}},"next":{"block":{"type":"blockMotorResetAngle","id":"IFlqJrKL^9z/PrhNx6j]","inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"aj)8,e#y@fK,EJt%H*^2","fields":{"VAR":{"id":"Lb2},;H,NK3nY.@}-|9Z","name":"left","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angle","id":"|conOpE5*x?,Pm;8Sic2","fields":{"VALUE0":0}}}},"next":{"block":{"type":"blockFunctionCallerStatement","id":"Ab4CWK?*5:/5H@tcZVr#","extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"-gZ2ZJ@V/_EY*X88@Ezv"}},"next":{"block":{"type":"blockFunctionCallerStatement","id":"B2p{]?~S@{+|YN}})0hG","extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"R3@).!$FV1JmI!aBR+j*"}},"next":{"block":{"type":"blockFunctionCallerStatement","id":"@+}7Nvck]+MIe`Um+1uD","extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"K.%c4_x;WiFx59gCol/v"}},"next":{"block":{"type":"blockFunctionCallerStatement","id":")T;M:RS6HQ_:N=7s`8P2","extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"A]Org,V@sS1clrrg+;=t"}}}}}}}}}}}}}}}}},{"type":"variables_setup_function","id":"KLzM_GchZ$~~oS!XPY$S","x":-565,"y":704,"extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"-gZ2ZJ@V/_EY*X88@Ezv"}},"inputs":{"STACK":{"block":{"type":"blockDriveBaseDrive2","id":"_ht~`;Q4+MN2;@?T@k`Y","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"jET8pYBfoM/X]Rp(;7G.","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"vMG^u7=CxY/r8CtgyAGS","fields":{"VALUE0":332}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"biCC6vh3i6J0%Oi^8p{R","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockFlowRepeat","id":"O,~NeX*H94,d#vW6#se7","inputs":{"TIMES":{"shadow":{"type":"blockMathNumber","id":"8GD{`iqbGeF9rAmi%d=b","fields":{"NUM":4}}},"DO":{"block":{"type":"blockMotorConfigure","id":"9nrz-Iu?7t{d2zTxK[vU","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_ACCELERATION"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"symrPWVI2Ld:F+?pffm/","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"ARG0":{"shadow":{"type":"unit_angularAcceleration","id":"Psf?[o8`bPcf8~bUJ+|M","fields":{"VALUE0":9000}}}},"next":{"block":{"type":"blockMotorRun","id":"QQMwxqc~hT+ypO:/=2v!","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"8Dj}oO!RPS|B^b(Caid^","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"`=wVuBp46gcO$p#,dlLD","fields":{"VALUE0":8000}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"8WZ]pvsoXm6,?#,NC{22","fields":{"VALUE0":580}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"Y}S0pjXO`^#;ha9jpe9x","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"~pyYwG[jj09WSmHUL!7n","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"9GCpUxnFB~u5d|4f_cx;","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"LTg$x@34f+*`cmy2hYzE","fields":{"VALUE0":8000}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"[5Ww?_H#6{DR%w5q:.^H","fields":{"VALUE0":-580}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"]K(}$^ZKQN!H$$~1vqOz","fields":{"VALUE":"Stop.HOLD"}}}}}}}}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"DUAW:Q@YJFAJDYL{zCHP","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"{.y(JYSi+%L$rXJKmV0o","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"GBHdiDh9}Jd?)CNKvmx}","fields":{"VALUE0":-30}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":";m*[bR%G_i#XwM)$:I{:","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"DM6gPxRu;w)~EOfuQ.k)","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"tnH[hg9;z~]OapK:^@A2","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"a}.KQ:}k6IU)`E-6*6lf","fields":{"VALUE0":400}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"dI#0QZvs-OJGfS]-E6#A","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"7*1.}UNM)RMf?8JI,*8=","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"A+Hc9Ko+)UWf,qqtAGK1","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"/7}Ks.e5DVTk;f2SgCC7","fields":{"VALUE0":35}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"D8g,;`Igmi0#a+xu_7#n","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"OpKhGCK54BwfD:~g^4E:","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"N_F-JAcwCwDZ2k:|{Jv:","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"{@YwXOgZ$TPhdw$wP/+3","fields":{"VALUE0":80}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"a((2J;Qc}Uy,1H)Bho+u","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"IJ-4PFN2J(3??8)$#naQ","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"y?Zixi!+/q2jk*:w)5-V","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":".AFQ_.1+3}t$X`![sj4,","fields":{"VALUE0":-35}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":",2#_!yqq#9Xp^wzU0wNt","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"os`w*7C4i]/2/$5S{yk3","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"rS-}^$Lps8[B!~/cevr1","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"/QR-P@v8:^fDsq#[Rozf","fields":{"VALUE0":30}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"X1FE8qc+.M1e0?T{zr}!","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"MTa]di*XgvLrxwm]1)m_","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"Ip@wW/U2TltQV:y-od%}","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"YU3%1,Y,D*yIu+rHs]2_","fields":{"VALUE0":-80}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"+)d_tFL/*,Ap]nlB8{Y+","fields":{"VALUE":"Stop.HOLD"}}}}}}}}}}}}}}}}}}}}}}}},{"type":"variables_setup_function","id":"AVhx`ZIm`MTQ?q+-L!P/","x":214,"y":752,"extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"R3@).!$FV1JmI!aBR+j*"}},"inputs":{"STACK":{"block":{"type":"blockDriveBaseDrive2","id":"f/]WyJDhtCsW($=:=c0E","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"k(fef8T`1EJI4u!z!=/k","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"c)uapfl~2$pAW{I0-5,T","fields":{"VALUE0":-60}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"#2u!plxVojZJTl7QQ!wK","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"Pq#H)0boi/cN1$$4Hn@k","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"H5M+.i1tg6bnw|*kv}r+","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"[_s-x_.:8*n#No016}%e","fields":{"VALUE0":250}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":".f1V51V=X?f|a%:xVVH.","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"jS-!,#+7ogLg(=~SHFoe","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"r[7uzVonHmUhBW+ACM-,","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"M[b,N0/4@igW!IeYH;7R","fields":{"VALUE0":-20}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"tKSm+?Y:XHog{RoRI^ji","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"~kQQ7N{7X7Wi]N{Rxz:_","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"GgQr)YX[s~/sq)TqZCab","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"Zw)B)8d3YKY0sOM.hD^A","fields":{"VALUE0":250}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"T6Dd.R;LE=Io;zj)J_2i","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"{4=JQnUw_vaB3V,6g#(T","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"f}0C0NX_$r9hTImCk=E6","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"G1w6J}a-LjfzQ-Ch#6XZ","fields":{"VALUE0":-140}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"LHfoo0Cp)93m3$,$)dF@","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"E;nNX5;Ei|ptZuvuwGwG","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"N[c!Q,6?l7Ih#T;J1drj","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"J|sbu-M$0tLBCJj=Ox_D","fields":{"VALUE0":400}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"M;8~4w^en|SepnxgZ?Og","fields":{"VALUE":"Stop.HOLD"}}}}}}}}}}}}}}}}}},{"type":"variables_setup_function","id":"J(B?Lo^R{37nl.XHg;R;","x":745,"y":1148,"extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"K.%c4_x;WiFx59gCol/v"}},"inputs":{"STACK":{"block":{"type":"blockDriveBaseDrive2","id":"Ia6~J4l/kLV@ER;}(0.X","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"-o=5Xb;JV0#!1HoYKowl","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"hf9`-nII#9qSf8~J!4|]","fields":{"VALUE0":-180}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"LKW*]w%v1tZVvqJa(+Tu","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"+2XuU6AwH^wNs{WpC,F`","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"Et[NJyuc~{.tJrD2/DU4","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"A`I|gbnUYIFoq.~`kh(G","fields":{"VALUE0":20}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"0Lk.=pv3vV1S/vnnVGxH","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"Hp@SRk-0:3knBd^%@G.g","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"M_0t0qcH)?A{Z5j.I:TB","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"jBkD9aq5Eo0oQfcm(IE*","fields":{"VALUE0":1000}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"cLGP5=zmypvI-$#._?Es","fields":{"VALUE0":700}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"fi.-{|2C;X]7EO+Q90Kw","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"cKt*F{[DVjAjk^/(:4BA","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"D:r^Crjft`al-cdzj1U)","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"pes1v${fSTK~Pmt=nuQ_","fields":{"VALUE0":1000}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"IZQ-Dm6UDg4Q`xdZeptL","fields":{"VALUE0":-700}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"pu)#{W[04hC+w%J`TJ;c","fields":{"VALUE":"Stop.HOLD"}}}}}}}}}}}}}},{"type":"variables_setup_function","id":"$ua4F_uP6g+%Ud#YYE$L","x":-560,"y":1477,"extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"A]Org,V@sS1clrrg+;=t"}},"inputs":{"STACK":{"block":{"type":"blockDriveBaseConfigure","id":"Jhoo{a.n+;--ou^IiKH~","extraState":{"optionLevel":1},"fields":{"METHOD":"DRIVEBASE_STRAIGHT_SPEED"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"q1kLD2u9KK^3mptR~(z1","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_speed","id":";;auP?N:0/$WwzMN#5-F","fields":{"VALUE0":700}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"+t41C{SPd#%V6,Z0)2!4","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"Z0anfw5RXjX`(PYPlho$","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"PMh0xTp}~Max:RJ6J,H-","fields":{"VALUE0":-60}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"DOkz}[V7xJ8$28x3_l@M","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"RJzD`9QVDv`c9|m.3i*o","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"=W{J0DDdlBt~oR_ggWaL","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"=]J_X7g31p#ggb#[$t3J","fields":{"VALUE0":350}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"iH[^a=jMB,}u-?mue,v|","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"hNJ4?rKv/#A0X%lS2Otq","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"~Zf.ZZ4hbUWSQmJg#~`_","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"pPXyWGlI$^B8FQEg@;J-","fields":{"VALUE0":40}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"H]~hSJ0H!]Ue2-6HFj!F","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"bF;YYqF}l8z:P_rOhsIl","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"]l7YzIs$laYyKCIN-cvC","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"~NTO7j#T{c3UZwTtKq6z","fields":{"VALUE0":630}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"Zm,P~!u,|m.5?h.~jh$*","fields":{"VALUE":"Stop.HOLD"}}}}}}}}}}}}}}}},{"type":"blockDriveBaseDrive2","id":"r$ASmul8XXCa.kX(LG{e","x":61,"y":1253,"enabled":false,"extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"-#Q*^JA[ZgHKkH%%$n61","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"I6%15d]{yRRWKOdVvFm`","fields":{"VALUE0":90}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"6UWevjzwm5[bYkr9l@`]","fields":{"VALUE":"Stop.HOLD"}}}}},{"type":"blockDriveBaseDrive2","id":"e}v`Odmumx23f#)V8ytX","x":103,"y":1326,"enabled":false,"extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"@Ug`O18?tjdw.fv?|^D?","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"7%?jw/g_+o#(-$dhx22*","fields":{"VALUE0":-28}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"PelFMhyzs2Y;aNsK^#pw","fields":{"VALUE":"Stop.HOLD"}}}}}]},"variables":[{"name":"red","id":"h$0V_Yt(t=Z^Js(/1{)%","type":"ColorDef"},{"name":"orange","id":"Xg:/5}AsI[+m17s6,v21","type":"ColorDef"},{"name":"yellow","id":"oK[2ogh@tBz;{#/Ha_d9","type":"ColorDef"},{"name":"green","id":"yDXVB7[1d,EwqspHqcRy","type":"ColorDef"},{"name":"cyan","id":"[Sqwy^o}3JlB#lf.C8K^","type":"ColorDef"},{"name":"blue","id":"%,Cxlm]us!PBq=L5sN58","type":"ColorDef"},{"name":"violet","id":"D1c;vx%^__7^E@2`Xe3_","type":"ColorDef"},{"name":"magenta","id":"tC]CPmaB)jb|Q/=D/TMe","type":"ColorDef"},{"name":"white","id":"3Us_]nt]o2gt*8t(}@Sw","type":"ColorDef"},{"name":"none","id":";VdF3wIsmw8D^^[|(@C(","type":"ColorDef"},{"name":"prime hub","id":"sNUcHq,4GbT0i33*%t,)","type":"PrimeHub"},{"name":"drive base","id":"~0u;A(JuO[Z-g!T!n@??","type":"DriveBase"},{"name":"right","id":"`#(M;o4ZYJq8tDB[iZ?C","type":"Motor"},{"name":"left","id":"Lb2},;H,NK3nY.@}-|9Z","type":"Motor"},{"name":"left gear","id":"1BViSmy2Le21h-xrhOd3","type":"Motor"},{"name":"Miission 8 and 5","id":"-gZ2ZJ@V/_EY*X88@Ezv","type":"Function"},{"name":"Mission 9-Push black lever","id":"R3@).!$FV1JmI!aBR+j*","type":"Function"},{"name":"Mission 10-Bucket 2","id":"K.%c4_x;WiFx59gCol/v","type":"Function"},{"name":"Coming Back from 10 Bucket","id":"A]Org,V@sS1clrrg+;=t","type":"Function"}],"info":{"type":"pybricks","version":"1.3.2"}}
-from pybricks.hubs import PrimeHub
-from pybricks.parameters import Direction, Port, Stop
-from pybricks.pupdevices import Motor
-from pybricks.robotics import DriveBase
-
-# Set up all devices.
-prime_hub = PrimeHub()
-right = Motor(Port.C, Direction.CLOCKWISE)
-left = Motor(Port.A, Direction.COUNTERCLOCKWISE)
-left_gear = Motor(Port.B, Direction.CLOCKWISE)
-drive_base = DriveBase(left, right, 56, 80)
+from engine import (FINISH, LEFT_GEAR, OSCILLATE, RUN_ANGLE, SETTINGS, START,
+                    STRAIGHT, TURN, run)
+from runtime import launch
+
+
+MIISSION_8_AND_5 = (
+    (STRAIGHT, 332),
+    (OSCILLATE, LEFT_GEAR, 8000, 580, 4, 9000, "mission 8"),
+    (TURN, -30),
+    (STRAIGHT, 400),
+    (TURN, 35),
+    (STRAIGHT, 80),
+    (TURN, -35),
+    (TURN, 30),
+    (STRAIGHT, -80),
+)
+
 
 def Miission_8_and_5():
-    drive_base.straight(332)
-    for count in range(4):
-        left_gear.control.limits(acceleration=9000)
-        left_gear.run_angle(8000, 580)
-        left_gear.run_angle(8000, -580)
-    drive_base.turn(-30)
-    drive_base.straight(400)
-    drive_base.turn(35)
-    drive_base.straight(80)
-    drive_base.turn(-35)
-    drive_base.turn(30)
-    drive_base.straight(-80)
+    run(MIISSION_8_AND_5)
+
+
+MISSION_9_PUSH_BLACK_LEVER = (
+    (TURN, -60),
+    (STRAIGHT, 250),
+    (TURN, -20),
+    (STRAIGHT, 250),
+    (TURN, -140),
+    (STRAIGHT, 400),
+)
+
 
 def Mission_9_Push_black_lever():
-    drive_base.turn(-60)
-    drive_base.straight(250)
-    drive_base.turn(-20)
-    drive_base.straight(250)
-    drive_base.turn(-140)
-    drive_base.straight(400)
+    run(MISSION_9_PUSH_BLACK_LEVER)
+
+
+MISSION_10_BUCKET_2 = (
+    (STRAIGHT, -180),
+    (TURN, 20),
+    (RUN_ANGLE, LEFT_GEAR, 1000, 700),
+    # Lower the arm on the way back, see Coming_Back_from_10_Bucket.
+    (START, LEFT_GEAR, 1000, -700),
+)
+
 
 def Mission_10_Bucket_2():
-    drive_base.straight(-180)
-    drive_base.turn(20)
-    left_gear.run_angle(1000, 700)
-    left_gear.run_angle(1000, -700)
+    run(MISSION_10_BUCKET_2)
+
+
+COMING_BACK_FROM_10_BUCKET = (
+    (SETTINGS, 700),
+    (TURN, -60),
+    (STRAIGHT, 350),
+    (TURN, 40),
+    (STRAIGHT, 630),
+    (FINISH,),
+)
+
 
 def Coming_Back_from_10_Bucket():
-    drive_base.settings(straight_speed=700)
-    drive_base.turn(-60)
-    drive_base.straight(350)
-    drive_base.turn(40)
-    drive_base.straight(630)
+    run(COMING_BACK_FROM_10_BUCKET)
+
+
+def missions_8_5_9_and_10():
+    Miission_8_and_5()
+    Mission_9_Push_black_lever()
+    Mission_10_Bucket_2()
+    Coming_Back_from_10_Bucket()
 
 
 # The main program starts here.
-drive_base.use_gyro(True)
-drive_base.reset(0, 0)
-left.reset_angle(0)
-Miission_8_and_5()
-Mission_9_Push_black_lever()
-Mission_10_Bucket_2()
-Coming_Back_from_10_Bucket()
+if __name__ == "__main__":
+    launch(missions_8_5_9_and_10)
@@ -0,0 +1,51 @@
+from math import pi
+
+from pybricks.tools import wait
+
+from calibration import geometry, store_geometry
+from runtime import drive_base, left, prime_hub, right
+
+# Measure the wheel diameter and axle track and store them on the hub for
+# every program to use. Place the robot square to a wall, facing away from
+# it, with its back WALL_GAP mm from the wall, and start the program. It
+# backs into the wall, drives out again and spins in place SPINS times.
+# The new numbers are used from the next program on.
+WALL_GAP = 300
+SPINS = 3
+SPEED = 100
+TURN_RATE = 90
+
+
+def wheel_degrees():
+    return (abs(left.angle()) + abs(right.angle())) / 2
+
+
+old_diameter, old_track = geometry(prime_hub)
+# Slow, even moves, whatever the battery.
+drive_base.compensator = None
+drive_base.use_gyro(False)
+drive_base.settings(straight_speed=SPEED, turn_rate=TURN_RATE)
+
+# Wheel diameter: how far the wheels turn to cover the gap to the wall.
+left.reset_angle(0)
+right.reset_angle(0)
+drive_base.straight(-(WALL_GAP + 100), wait=False)
+while not drive_base.done() and not drive_base.stalled():
+    wait(10)
+drive_base.stop()
+wheel_diameter = WALL_GAP * 360 / (pi * wheel_degrees())
+drive_base.straight(100)
+
+# Axle track: how far the wheels turn for a turn measured on the gyro.
+wait(500)
+prime_hub.imu.reset_heading(0)
+left.reset_angle(0)
+right.reset_angle(0)
+drive_base.turn(360 * SPINS)
+wait(500)
+axle_track = wheel_diameter * wheel_degrees() / abs(prime_hub.imu.heading())
+
+store_geometry(prime_hub, wheel_diameter, axle_track)
+print("wheel diameter {:.2f} mm, was {:.2f}".format(
+    wheel_diameter, old_diameter))
+print("axle track {:.2f} mm, was {:.2f}".format(axle_track, old_track))
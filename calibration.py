@@ -0,0 +1,70 @@
+from math import pi
+
+# The drive base geometry is kept in the hub's storage, which keeps its
+# contents between programs, so every program uses the numbers measured
+# by calibrate.py. Until then the nominal numbers are used.
+OFFSET = 0
+MAGIC = b"cal1"
+WHEEL_DIAMETER = 56
+AXLE_TRACK = 80
+
+# Motor model for compensation. With no load a wheel motor reaches its
+# full FULL_SPEED deg/s from REFERENCE_MV up, and proportionally less at a
+# lower voltage or a higher load, down to nothing at STALL_LOAD mNm. Speeds
+# the motors cannot reach are capped, and accelerations are scaled down by
+# the same factor. On a charged battery with no load nothing changes.
+REFERENCE_MV = 7800
+FULL_SPEED = 1000
+STALL_LOAD = 500
+MIN_FACTOR = 0.3
+# A load counts for half as much in each move after the one it was seen in.
+LOAD_DECAY = 0.5
+
+
+def geometry(hub):
+    # Return the (wheel diameter, axle track) in mm stored on the hub.
+    data = hub.system.storage(OFFSET, read=8)
+    if data[:4] != MAGIC:
+        return WHEEL_DIAMETER, AXLE_TRACK
+    return (int.from_bytes(data[4:6], "little") / 100,
+            int.from_bytes(data[6:8], "little") / 100)
+
+
+def store_geometry(hub, wheel_diameter, axle_track):
+    hub.system.storage(OFFSET, write=MAGIC
+                       + int(wheel_diameter * 100).to_bytes(2, "little")
+                       + int(axle_track * 100).to_bytes(2, "little"))
+
+
+class Compensator:
+    # Limits the drive base settings to what the wheel motors can do at the
+    # battery voltage and load of the moment, so a move covers the same
+    # distance on a full battery as on a low one. The load is read from the
+    # wheel motors as each move starts: they still hold the robot after the
+    # move before it, so a push against a model or a slope shows there.
+
+    def __init__(self, hub, motors, wheel_diameter, axle_track):
+        self.hub = hub
+        self.motors = motors
+        self.mm_per_degree = pi * wheel_diameter / 360
+        self.half_track = axle_track / 2
+        self.load = 0
+
+    def factor(self):
+        volts = min(1, self.hub.battery.voltage() / REFERENCE_MV)
+        load = max(abs(motor.load()) for motor in self.motors)
+        self.load = max(load, self.load * LOAD_DECAY)
+        return max(MIN_FACTOR, volts * (1 - self.load / STALL_LOAD))
+
+    def limit(self, settings):
+        # Return settings (speed, acceleration, turn rate, turn
+        # acceleration) within the limits of the moment.
+        factor = self.factor()
+        if factor >= 1:
+            return settings
+        speed, acceleration, turn_rate, turn_acceleration = settings
+        top = FULL_SPEED * factor * self.mm_per_degree
+        top_rate = top / self.half_track * 180 / pi
+        return (int(min(speed, top)), int(acceleration * factor),
+                int(min(turn_rate, top_rate)),
+                int(turn_acceleration * factor))
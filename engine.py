@@ -0,0 +1,157 @@
+import sys
+
+from pybricks.tools import StopWatch, wait
+
+import runtime
+from parallel import finish, start
+from strokes import oscillate
+from waits import until_done, until_settled, until_still
+
+# Missions are tables of steps. A step is a tuple of an opcode and its
+# arguments; None leaves a setting as it is.
+STRAIGHT = 0  # (STRAIGHT, mm)
+TURN = 1  # (TURN, degrees)
+ARC = 2  # (ARC, radius, degrees)
+ARC_DISTANCE = 3  # (ARC_DISTANCE, radius, mm)
+RUN_ANGLE = 4  # (RUN_ANGLE, motor, speed, degrees[, then])
+START = 5  # (START, motor, speed, degrees), see parallel.start
+FINISH = 6  # (FINISH[, motor]), see parallel.finish
+SETTINGS = 7  # (SETTINGS, speed, acceleration, turn rate, turn acceleration)
+LIMITS = 8  # (LIMITS, motor, speed, acceleration, torque)
+WAIT = 9  # (WAIT, ms)
+RESET_ANGLE = 10  # (RESET_ANGLE, motor, degrees)
+UNTIL_DONE = 11  # (UNTIL_DONE, motor, timeout[, label]), see waits.py
+UNTIL_SETTLED = 12  # (UNTIL_SETTLED, timeout[, label])
+REPEAT = 13  # (REPEAT, count, steps)
+GO_TO = 14  # (GO_TO, x, y[, heading, speed, backwards]), see nav.py
+ALIGN = 15  # (ALIGN, heading[, x, y, distance])
+OSCILLATE = 16  # (OSCILLATE, motor, speed, degrees, times[, acc, label])
+UNTIL_STILL = 17  # (UNTIL_STILL, timeout[, label])
+
+# Motors, by number.
+LEFT_GEAR = 0
+RIGHT_GEAR = 1
+LEFT = 2
+RIGHT = 3
+
+
+def motor(number):
+    # Looked up on every use, so the motors set up by runtime.record() are
+    # used when recording.
+    if number == LEFT_GEAR:
+        return runtime.left_gear
+    if number == RIGHT_GEAR:
+        return runtime.right_gear()
+    if number == LEFT:
+        return runtime.left
+    return runtime.right
+
+
+class Profile:
+    # Time taken by every step of the tables that ran, see profiler.py.
+
+    def __init__(self):
+        self.entries = []
+        self.found = {}
+
+    def add(self, steps, index, ms):
+        key = (id(steps), index)
+        entry = self.found.get(key)
+        if entry is None:
+            entry = [steps, index, 0, 0]
+            self.found[key] = entry
+            self.entries.append(entry)
+        entry[2] += ms
+        entry[3] += 1
+
+    def report(self, mission):
+        # Print the time of every step, in the order they first ran. The
+        # host reads this with host/bench.py --hub.
+        names = {}
+        print("profile", mission)
+        print("table,step,ms,count,step")
+        for steps, index, ms, count in self.entries:
+            if id(steps) not in names:
+                names[id(steps)] = table_name(steps)
+            print("{},{},{},{},{}".format(
+                names[id(steps)], index, ms, count, steps[index]))
+        print("end")
+
+
+def table_name(steps):
+    # "module.TABLE" of a mission table, found among the loaded modules.
+    for module_name, module in sys.modules.items():
+        for name in dir(module):
+            if getattr(module, name, None) is steps:
+                return module_name + "." + name
+    return "?"
+
+
+# Set to a Profile to time every step.
+profile = None
+watch = StopWatch()
+
+
+def run(steps):
+    # Run the steps of a mission table in order.
+    drive_base = runtime.drive_base
+    for index in range(len(steps)):
+        if profile is None:
+            do(drive_base, steps[index], index)
+        else:
+            started = watch.time()
+            do(drive_base, steps[index], index)
+            profile.add(steps, index, watch.time() - started)
+
+
+def do(drive_base, step, index):
+    # Run one step.
+    op = step[0]
+    if op == STRAIGHT:
+        drive_base.straight(step[1])
+    elif op == TURN:
+        drive_base.turn(step[1])
+    elif op == ARC:
+        drive_base.arc(step[1], angle=step[2])
+    elif op == ARC_DISTANCE:
+        drive_base.arc(step[1], distance=step[2])
+    elif op == RUN_ANGLE:
+        if len(step) > 4:
+            motor(step[1]).run_angle(step[2], step[3], step[4])
+        else:
+            motor(step[1]).run_angle(step[2], step[3])
+    elif op == START:
+        start(motor(step[1]), step[2], step[3])
+    elif op == FINISH:
+        if len(step) > 1:
+            finish(motor(step[1]))
+        else:
+            finish()
+    elif op == SETTINGS:
+        drive_base.settings(*step[1:])
+    elif op == LIMITS:
+        motor(step[1]).control.limits(*step[2:])
+    elif op == WAIT:
+        wait(step[1])
+    elif op == RESET_ANGLE:
+        motor(step[1]).reset_angle(step[2])
+    elif op == UNTIL_DONE:
+        until_done(motor(step[1]), *step[2:])
+    elif op == UNTIL_SETTLED:
+        until_settled(drive_base, *step[1:])
+    elif op == UNTIL_STILL:
+        until_still(runtime.prime_hub, *step[1:])
+    elif op == GO_TO:
+        runtime.navigator.go_to(*step[1:])
+    elif op == ALIGN:
+        runtime.navigator.align(*step[1:])
+    elif op == OSCILLATE:
+        oscillate(motor(step[1]), *step[2:])
+    elif op == REPEAT:
+        # Not through run(): the REPEAT step is profiled as a whole, so its
+        # steps are not counted a second time.
+        for _ in range(step[1]):
+            for nested in step[2]:
+                do(drive_base, nested, index)
+    else:
+        raise ValueError("unknown opcode {} in step {}".format(op, index))
@@ -0,0 +1,219 @@
+"""Summarize telemetry recorded on the hub with ``record.py``.
+
+Usage::
+
+    python host/analyze.py run1.txt run2.txt run3.txt
+
+The files are saved console output; each may hold any number of
+recordings, and lines around them are ignored. Recordings of the same
+mission are taken as repeated runs. For every step the report gives the
+time it took, how far it overshot its target, how long it took to settle
+within ``TOLERANCE`` of the target and where it ended, as the mean over the
+runs followed by the spread (standard deviation) between them.
+
+Samples are only kept for the last part of a long run, so overshoot and
+settle times may be missing for early steps; step times are always there.
+"""
+
+import argparse
+import math
+import statistics
+import sys
+
+# How close to the target a step must stay to count as settled, in mm for
+# distances and degrees for headings and motor angles.
+TOLERANCE = {"distance": 2, "angle": 1, "motor": 2}
+
+
+class Recording:
+    """One telemetry dump: its steps and the samples that were kept."""
+
+    def __init__(self, mission, period):
+        self.mission = mission
+        self.period = period
+        self.steps = []
+        self.columns = []
+        self.rows = []
+
+    def column(self, name):
+        """Return ``[(time, step, value)]`` for a column, in real units."""
+        index = self.columns.index(name)
+        time, step = self.columns.index("time"), self.columns.index("step")
+        scale = 10 if name.endswith("10") else 1
+        return [(row[time], row[step], row[index] / scale)
+                for row in self.rows]
+
+
+def read(lines):
+    """Yield the Recordings found in the lines of a console log."""
+    recording = section = None
+    for line in lines:
+        line = line.strip()
+        if line.startswith("telemetry "):
+            _, mission, period = line.split()
+            recording = Recording(mission, int(period))
+            section = None
+        elif recording is None:
+            continue
+        elif line == "end":
+            yield recording
+            recording = None
+        elif line.startswith("steps "):
+            section = "steps"
+        elif line.startswith("samples "):
+            section = "samples"
+            recording.columns = line.split(" ", 1)[1].split(",")
+        elif section == "steps":
+            step, start, end, label = line.split(",", 3)
+            recording.steps.append((int(step), int(start), int(end), label))
+        elif section == "samples":
+            recording.rows.append([int(v) for v in line.split(",")])
+
+
+def _value(text):
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def parse_label(label):
+    """Split ``"left_gear.run_angle(200, 450)"`` into its parts.
+
+    Returns ``(device, method, positional arguments, keyword arguments)``.
+    """
+    call, _, rest = label.partition("(")
+    device, _, method = call.rpartition(".")
+    args, kwargs = [], {}
+    for part in rest.rstrip(")").split(", "):
+        if not part:
+            continue
+        key, equals, value = part.partition("=")
+        if equals:
+            kwargs[key] = _value(value)
+        else:
+            args.append(_value(part))
+    return device, method, args, kwargs
+
+
+def target(label):
+    """Return ``(column, kind, change, absolute target)`` of a step.
+
+    Only one of ``change`` and ``absolute target`` is given. Returns None
+    for steps without a target.
+    """
+    device, method, args, kwargs = parse_label(label)
+    if method == "straight":
+        return "distance", "distance", args[0], None
+    if method == "turn":
+        return "angle10", "angle", args[0], None
+    if method == "arc":
+        radius = args[0]
+        angle = kwargs.get("angle", args[1] if len(args) > 1 else None)
+        distance = kwargs.get("distance", args[2] if len(args) > 2 else None)
+        if distance is not None:
+            return "distance", "distance", distance, None
+        return "angle10", "angle", angle * math.copysign(1, radius), None
+    if method == "run_angle":
+        speed, angle = args[:2]
+        return (device + ".angle", "motor",
+                abs(angle) * math.copysign(1, speed * angle), None)
+    if method == "run_target":
+        return device + ".angle", "motor", None, args[1]
+    return None
+
+
+class Step:
+    """Measurements of one step of one run."""
+
+    def __init__(self, recording, step, start, end, label):
+        self.label = label
+        self.duration = end - start
+        self.overshoot = self.settle = self.error = None
+        goal = target(label)
+        # Moves started with wait=False end as they start and are not
+        # followed.
+        if goal is None or end == start or not recording.rows:
+            return
+        column, kind, change, absolute = goal
+        if column not in recording.columns:
+            return
+        values = [(t, v) for t, s, v in recording.column(column) if s == step]
+        # The first sample of a step is taken as it starts; without it the
+        # samples of the step were overwritten.
+        if not values or values[0][0] != start:
+            return
+        first = values[0][1]
+        aim = absolute if absolute is not None else first + change
+        direction = 1 if aim >= first else -1
+        self.overshoot = max(0, max((v - aim) * direction for _, v in values))
+        self.error = values[-1][1] - aim
+        tolerance = TOLERANCE[kind]
+        self.settle = 0
+        for i, (t, v) in enumerate(values):
+            if abs(v - aim) > tolerance:
+                self.settle = (values[i + 1][0] - start
+                               if i + 1 < len(values) else None)
+
+
+def _spread(values):
+    return statistics.stdev(values) if len(values) > 1 else 0.0
+
+
+def _mean(values):
+    values = [v for v in values if v is not None]
+    return statistics.mean(values) if values else None
+
+
+def _fmt(value, width, digits):
+    if value is None:
+        return "-".rjust(width)
+    return "{:{}.{}f}".format(value, width, digits)
+
+
+def summarize(recordings, out):
+    """Write the step table for the runs of one mission."""
+    runs = [[Step(r, *s) for s in r.steps] for r in recordings]
+    labels = [step.label for step in runs[0]]
+    if any([step.label for step in run] != labels for run in runs):
+        out.write("  the runs took different steps; only comparing the "
+                  "steps they share\n")
+    out.write("  {:>4}  {:<36} {:>7} {:>6} {:>9} {:>7} {:>7} {:>6}\n".format(
+        "step", "call", "ms", "+-ms", "overshoot", "settle", "error", "+-"))
+    for index, label in enumerate(labels):
+        steps = [run[index] for run in runs
+                 if index < len(run) and run[index].label == label]
+        durations = [s.duration for s in steps]
+        errors = [s.error for s in steps if s.error is not None]
+        out.write("  {:>4}  {:<36} {:7.0f} {:6.0f} {} {} {} {}\n".format(
+            index, label[:36], statistics.mean(durations),
+            _spread(durations),
+            _fmt(_mean(s.overshoot for s in steps), 9, 1),
+            _fmt(_mean(s.settle for s in steps), 7, 0),
+            _fmt(_mean(errors), 7, 1),
+            _fmt(_spread(errors) if errors else None, 6, 1)))
+    totals = [r.steps[-1][2] for r in recordings if r.steps]
+    if totals:
+        out.write("  total {:.2f} s, +-{:.2f} s over {} run(s)\n".format(
+            statistics.mean(totals) / 1000, _spread(totals) / 1000,
+            len(totals)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("logs", nargs="+", help="saved console output")
+    args = parser.parse_args(argv)
+    missions = {}
+    for path in args.logs:
+        with open(path) as f:
+            for recording in read(f):
+                missions.setdefault(recording.mission, []).append(recording)
+    if not missions:
+        parser.error("no telemetry found")
+    for mission, recordings in missions.items():
+        sys.stdout.write("== {}, {} run(s)\n".format(mission, len(recordings)))
+        summarize(recordings, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Time every menu program and flag the ones that got slower.
+
+Usage::
+
+    python host/bench.py
+    python host/bench.py --profile E
+    python host/bench.py --update
+    python host/bench.py --hub run1.txt run2.txt
+
+Every program in ``programs.py`` is run through ``Menu.py`` in the
+simulator, or, with ``--hub``, read from the console output of
+``profiler.py`` runs on the hub. Its total time and the time of every step
+are compared with the baseline in ``benchmarks.json``; a program or step
+that takes more than ``--threshold`` percent and ``MIN_MS`` longer than
+its baseline is flagged, and the exit status is 1. ``--update`` stores the
+current times as the new baseline. ``--profile`` prints the time of every
+step of the given programs with its source line.
+
+Steps are the entries of the mission tables run by ``engine.py``, so a
+step keeps its name when lines are added above it.
+"""
+
+import argparse
+import ast
+import contextlib
+import io
+import json
+import os
+import sys
+
+import sim
+
+BASELINE = os.path.join(sim.HOST, "benchmarks.json")
+THRESHOLD = 5
+# Changes smaller than this, in ms, are noise.
+MIN_MS = 50
+
+
+class Timing:
+    """Total and per-step times of one program."""
+
+    def __init__(self, letter, function, total=0, steps=None):
+        self.letter = letter
+        self.function = function
+        self.total = total
+        # {"file NAME#step": ms}, where NAME is a table or mission function.
+        self.steps = steps or {}
+
+    def to_json(self):
+        return {"program": self.function, "total": round(self.total),
+                "steps": {k: round(v) for k, v in self.steps.items()}}
+
+
+def programs():
+    """Return ``[(letter, function, file)]`` from ``programs.py``."""
+    path = os.path.join(sim.ROOT, "programs.py")
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    modules = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                modules[alias.name] = node.module + ".py"
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict):
+            return [(key.value, value.id, modules[value.id])
+                    for key, value in zip(node.value.keys, node.value.values)]
+    return []
+
+
+def step_key(call):
+    """Key of the step a simulated call belongs to."""
+    path, _, rest = call.where.partition(":")
+    _, hash_, step = rest.partition("#")
+    if hash_:
+        return "{} {}#{}".format(path, call.function, step)
+    return "{} {}:{}".format(path, call.function, rest)
+
+
+def simulate(letter, function):
+    # The missions' own prints would bury the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = sim.run("Menu.py", [letter])
+    timing = Timing(letter, function, result.total)
+    for call in result.calls:
+        key = step_key(call)
+        timing.steps[key] = timing.steps.get(key, 0) + call.duration
+    return timing
+
+
+def read_profiles(paths):
+    """Return ``{mission: [{key: ms}]}`` from saved ``profiler.py`` output."""
+    runs = {}
+    for path in paths:
+        mission = None
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("profile "):
+                    mission = line.split()[1]
+                    steps = {}
+                elif mission is None or line.startswith("table,"):
+                    continue
+                elif line == "end":
+                    runs.setdefault(mission, []).append(steps)
+                    mission = None
+                else:
+                    table, step, ms, _ = line.split(",", 3)
+                    module, _, name = table.rpartition(".")
+                    key = "{}.py {}#{}".format(module, name, step)
+                    steps[key] = steps.get(key, 0) + int(ms)
+    return runs
+
+
+def from_profiles(paths):
+    runs = read_profiles(paths)
+    timings = []
+    for letter, function, _ in programs():
+        if function not in runs:
+            continue
+        timing = Timing(letter, function)
+        for steps in runs[function]:
+            for key, ms in steps.items():
+                timing.steps[key] = (timing.steps.get(key, 0)
+                                     + ms / len(runs[function]))
+        timing.total = sum(timing.steps.values())
+        timings.append(timing)
+    return timings
+
+
+_sources = {}
+
+
+def source(key):
+    """Return ``"file:line text"`` of the source of a step key."""
+    path, _, rest = key.partition(" ")
+    name, hash_, step = rest.partition("#")
+    if not hash_:
+        return "{}:{}".format(path, name.partition(":")[2])
+    if path not in _sources:
+        _sources[path] = _tables(os.path.join(sim.ROOT, path))
+    tables, runs = _sources[path]
+    lines = tables.get(runs.get(name, name))
+    if lines is None or int(step) >= len(lines):
+        return "{} {}#{}".format(path, name, step)
+    number, text = lines[int(step)]
+    return "{}:{} {}".format(path, number, text)
+
+
+def _tables(path):
+    """Return the mission tables of a module and the functions running them.
+
+    ``({TABLE: [(line, text)]}, {function: TABLE})``.
+    """
+    if not os.path.exists(path):
+        return {}, {}
+    with open(path) as f:
+        text = f.read()
+    tree = ast.parse(text)
+    tables, runs = {}, {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.value, ast.Tuple)):
+            tables[node.targets[0].id] = [
+                (elt.lineno, ast.get_source_segment(text, elt))
+                for elt in node.value.elts]
+        elif isinstance(node, ast.FunctionDef):
+            for call in ast.walk(node):
+                if (isinstance(call, ast.Call)
+                        and getattr(call.func, "id", None) == "run"
+                        and call.args and isinstance(call.args[0], ast.Name)):
+                    runs[node.name] = call.args[0].id
+    return tables, runs
+
+
+def slower(now, before, threshold):
+    return (now - before > MIN_MS
+            and now > before * (1 + threshold / 100))
+
+
+def compare(timings, baseline, threshold, out):
+    """Write the comparison; return the number of programs that got slower."""
+    count = 0
+    for timing in timings:
+        old = baseline.get(timing.letter)
+        if old is None or old["program"] != timing.function:
+            out.write("{} {:<26} {:7.2f} s  no baseline\n".format(
+                timing.letter, timing.function, timing.total / 1000))
+            continue
+        flags = []
+        if slower(timing.total, old["total"], threshold):
+            flags.append("  SLOWER in total\n")
+        for key, ms in timing.steps.items():
+            was = old["steps"].get(key)
+            if was is not None and slower(ms, was, threshold):
+                flags.append("  SLOWER {}: {:.0f} ms, was {} ms\n".format(
+                    source(key), ms, was))
+        out.write("{} {:<26} {:7.2f} s  baseline {:7.2f} s{}\n".format(
+            timing.letter, timing.function, timing.total / 1000,
+            old["total"] / 1000, "" if not flags else "  slower"))
+        for flag in flags:
+            out.write(flag)
+        count += bool(flags)
+    return count
+
+
+def profile(timing, out):
+    """Write the time of every step of a program, in run order."""
+    out.write("== {} {}\n".format(timing.letter, timing.function))
+    for key, ms in timing.steps.items():
+        if ms:
+            out.write("  {:7.0f} ms {:5.1%}  {}\n".format(
+                ms, ms / timing.total, source(key)))
+    out.write("  {:7.0f} ms total\n".format(timing.total))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hub", nargs="+", metavar="LOG",
+                        help="use saved profiler.py output, not the simulator")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="percent slower that counts as a regression")
+    parser.add_argument("--update", action="store_true",
+                        help="store these times as the baseline")
+    parser.add_argument("--profile", action="append", default=[],
+                        metavar="LETTER", help="list the steps of a program")
+    args = parser.parse_args(argv)
+
+    if args.hub:
+        source_name, timings = "hub", from_profiles(args.hub)
+    else:
+        source_name = "sim"
+        timings = [simulate(letter, function)
+                   for letter, function, _ in programs()]
+    for timing in timings:
+        if timing.letter in args.profile:
+            profile(timing, sys.stdout)
+
+    stored = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as f:
+            stored = json.load(f)
+    if args.update:
+        stored[source_name] = {t.letter: t.to_json() for t in timings}
+        with open(BASELINE, "w") as f:
+            json.dump(stored, f, indent=1, sort_keys=True)
+            f.write("\n")
+        print("stored {} baseline of {} programs".format(
+            source_name, len(timings)))
+        return
+    count = compare(timings, stored.get(source_name, {}), args.threshold,
+                    sys.stdout)
+    if count:
+        print("{} program(s) slower than the baseline".format(count))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""Convert mission modules to mission tables run by ``engine.py``.
+
+Usage::
+
+    python host/convert.py mission_6.py
+    python host/convert.py --write mission_6.py mission_7.py
+
+Every mission function made of drive base, navigator, attachment motor,
+``parallel``, ``strokes`` and ``waits`` calls becomes a table of steps,
+and the function is left as ``run(TABLE)`` so menus, ``launch()`` and the
+host tools still see it. Functions that only call other missions are kept
+as they are. Comments in the mission code are carried over to the table.
+A call with no opcode stops the conversion of its module with the line
+number, and the module is left alone. So is a module without mission
+functions, such as one that drives the robot from top-level code; move
+that code into a function first.
+
+Without ``--write`` the converted module is printed.
+"""
+
+import argparse
+import ast
+import re
+import sys
+
+# Motor variables of runtime.py and their numbers in engine.py.
+MOTORS = {"left_gear": "LEFT_GEAR", "left": "LEFT", "right": "RIGHT"}
+SETTINGS = ("straight_speed", "straight_acceleration", "turn_rate",
+            "turn_acceleration")
+LIMITS = ("speed", "acceleration", "torque")
+
+
+class Unsupported(Exception):
+    def __init__(self, node, why):
+        super().__init__("line {}: {}".format(node.lineno, why))
+
+
+class Converter:
+    def __init__(self, source):
+        self.source = source
+        self.lines = source.splitlines()
+        self.motors = dict(MOTORS)
+        self.used = {"run"}
+
+    def text(self, node):
+        return ast.get_source_segment(self.source, node)
+
+    def op(self, name, *args):
+        self.used.add(name)
+        parts = [name] + [a for a in args]
+        while parts[-1] == "None" and len(parts) > 1:
+            parts.pop()
+        if len(parts) == 1:
+            return "({},)".format(parts[0])
+        return "({})".format(", ".join(parts))
+
+    def motor(self, node):
+        if isinstance(node, ast.Call) and getattr(
+                node.func, "id", None) == "right_gear":
+            name = "RIGHT_GEAR"
+        elif isinstance(node, ast.Name) and node.id in self.motors:
+            name = self.motors[node.id]
+        else:
+            raise Unsupported(node, "unknown motor {}".format(self.text(node)))
+        self.used.add(name)
+        return name
+
+    def arguments(self, call, names):
+        """Positional and keyword arguments of ``call`` as source text."""
+        values = [self.text(a) for a in call.args]
+        values += ["None"] * (len(names) - len(values))
+        for keyword in call.keywords:
+            if keyword.arg not in names:
+                raise Unsupported(call, "argument {}".format(keyword.arg))
+            values[names.index(keyword.arg)] = self.text(keyword.value)
+        if len(values) > len(names):
+            raise Unsupported(call, "too many arguments")
+        return values
+
+    def step(self, node):
+        """Return the table entry for one statement, or None to skip it."""
+        if isinstance(node, ast.Assign):
+            # gear = right_gear()
+            if (len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name)
+                    and isinstance(node.value, ast.Call)
+                    and getattr(node.value.func, "id", None) == "right_gear"):
+                self.motors[node.targets[0].id] = "RIGHT_GEAR"
+                return None
+            raise Unsupported(node, "assignment")
+        if not isinstance(node, ast.Expr) or not isinstance(
+                node.value, ast.Call):
+            raise Unsupported(node, "not a call")
+        call = node.value
+        func = call.func
+        if isinstance(func, ast.Name):
+            return self.function_step(call, func.id)
+        if not isinstance(func, ast.Attribute):
+            raise Unsupported(node, self.text(call))
+        method, owner = func.attr, func.value
+        if isinstance(owner, ast.Name) and owner.id == "drive_base":
+            return self.drive_step(call, method)
+        if isinstance(owner, ast.Name) and owner.id == "navigator":
+            return self.navigator_step(call, method)
+        if (method == "limits" and isinstance(owner, ast.Attribute)
+                and owner.attr == "control"):
+            return self.op("LIMITS", self.motor(owner.value),
+                           *self.arguments(call, LIMITS))
+        motor = self.motor(owner)
+        if method == "run_angle":
+            speed, angle, then = self.arguments(
+                call, ("speed", "rotation_angle", "then"))
+            return self.op("RUN_ANGLE", motor, speed, angle, then)
+        if method == "reset_angle" and call.args:
+            return self.op("RESET_ANGLE", motor, self.text(call.args[0]))
+        raise Unsupported(node, self.text(call))
+
+    def drive_step(self, call, method):
+        if method in ("straight", "turn"):
+            (value,) = self.arguments(call, ("value",))
+            return self.op(method.upper(), value)
+        if method == "arc":
+            radius, angle, distance = self.arguments(
+                call, ("radius", "angle", "distance"))
+            if distance != "None":
+                return self.op("ARC_DISTANCE", radius, distance)
+            return self.op("ARC", radius, angle)
+        if method == "settings" and (call.args or call.keywords):
+            return self.op("SETTINGS", *self.arguments(call, SETTINGS))
+        raise Unsupported(call, self.text(call))
+
+    def navigator_step(self, call, method):
+        if method == "go_to":
+            return self.op("GO_TO", *self.arguments(
+                call, ("x", "y", "heading", "speed", "backwards")))
+        if method == "align":
+            return self.op("ALIGN", *self.arguments(
+                call, ("heading", "x", "y", "distance")))
+        raise Unsupported(call, self.text(call))
+
+    def function_step(self, call, name):
+        if name == "wait":
+            return self.op("WAIT", *self.arguments(call, ("time",)))
+        if name == "start":
+            motor = self.motor(call.args[0])
+            speed, angle = (self.text(a) for a in call.args[1:3])
+            if len(call.args) > 3 or call.keywords:
+                raise Unsupported(call, "start with a stop mode")
+            return self.op("START", motor, speed, angle)
+        if name == "finish":
+            if len(call.args) > 1:
+                raise Unsupported(call, "finish with several motors")
+            return self.op("FINISH", *(self.motor(a) for a in call.args))
+        if name == "oscillate":
+            motor = self.motor(call.args[0])
+            return self.op("OSCILLATE", motor, *self.arguments(
+                call, ("motor", "speed", "angle", "times", "acceleration",
+                       "label"))[1:])
+        if name == "until_done":
+            motor = self.motor(call.args[0])
+            return self.op("UNTIL_DONE", motor, *self.arguments(
+                call, ("motor", "timeout", "label"))[1:])
+        if name == "until_settled":
+            return self.op("UNTIL_SETTLED", *self.arguments(
+                call, ("drive_base", "timeout", "label"))[1:])
+        if name == "until_still":
+            return self.op("UNTIL_STILL", *self.arguments(
+                call, ("hub", "timeout", "label"))[1:])
+        raise Unsupported(call, self.text(call))
+
+    def comments(self, start, end):
+        """Comment lines between source lines ``start`` and ``end``."""
+        return [line.strip() for line in self.lines[start:end - 1]
+                if line.strip().startswith("#")]
+
+    def table(self, body, previous, indent):
+        """Return the lines of the steps for a list of statements."""
+        lines = []
+        pad = " " * indent
+        for node in body:
+            lines += [pad + c for c in self.comments(previous, node.lineno)]
+            previous = node.end_lineno
+            if isinstance(node, ast.For):
+                count = self.repeat_count(node)
+                self.used.add("REPEAT")
+                lines.append("{}(REPEAT, {}, (".format(pad, count))
+                lines += self.table(node.body, node.lineno, indent + 4)
+                lines.append(pad + ")),")
+                continue
+            entry = self.step(node)
+            if entry is not None:
+                lines.append(pad + entry + ",")
+        return lines
+
+    def repeat_count(self, node):
+        it = node.iter
+        if (isinstance(it, ast.Call)
+                and getattr(it.func, "id", None) == "range"
+                and len(it.args) == 1 and not node.orelse):
+            return self.text(it.args[0])
+        raise Unsupported(node, "only for loops over range(count)")
+
+
+def _calls_only(function, names):
+    return all(isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)
+               and getattr(node.value.func, "id", None) in names
+               and not node.value.args for node in function.body)
+
+
+def _simple(node):
+    return not isinstance(node, (ast.FunctionDef, ast.ClassDef))
+
+
+def convert(source):
+    """Return the module ``source`` rewritten to use mission tables.
+
+    Raises ``Unsupported`` for a call with no opcode, and ``ValueError`` if
+    the module has no mission function to convert.
+    """
+    tree = ast.parse(source)
+    converter = Converter(source)
+    functions = {node.name for node in tree.body
+                 if isinstance(node, ast.FunctionDef)}
+    imports = [node for node in tree.body
+               if isinstance(node, (ast.Import, ast.ImportFrom))]
+    body = ""
+    previous = None
+    tables = 0
+    for node in tree.body:
+        if node in imports:
+            continue
+        if isinstance(node, ast.FunctionDef) and not _calls_only(
+                node, functions):
+            name = node.name.upper()
+            lines = ["{} = (".format(name)]
+            lines += converter.table(node.body, node.lineno, 4)
+            lines.append(")")
+            text = "\n".join(lines) + "\n\n\ndef {}():\n    run({})".format(
+                node.name, name)
+            tables += 1
+        else:
+            start = node.lineno
+            if getattr(node, "decorator_list", None):
+                start = node.decorator_list[0].lineno
+            while (start > 1
+                   and converter.lines[start - 2].strip().startswith("#")):
+                start -= 1
+            text = "\n".join(converter.lines[start - 1:node.end_lineno])
+        if not body:
+            body = text
+        elif _simple(previous) and _simple(node):
+            # Statements that followed each other stay together, with the
+            # blank lines they had.
+            between = converter.lines[previous.end_lineno:start - 1]
+            body += "\n" * (len(between) + 1) + text
+        else:
+            body += "\n\n\n" + text
+        previous = node
+    if not tables:
+        raise ValueError("no mission functions to convert; code outside "
+                         "functions is left as it is")
+
+    # Keep the imported names the new code still uses, and add engine.py.
+    groups = {}
+    for node in imports:
+        if isinstance(node, ast.Import):
+            continue
+        names = [a.name for a in node.names
+                 if re.search(r"\b{}\b".format(a.name), body)]
+        if names:
+            groups[node.module] = names
+    groups["engine"] = sorted(converter.used)
+    pybricks = sorted(m for m in groups if m.startswith("pybricks"))
+    local = sorted(m for m in groups if not m.startswith("pybricks"))
+    blocks = []
+    for modules in (pybricks, local):
+        if modules:
+            blocks.append("\n".join(
+                import_line(m, groups[m]) for m in modules))
+    return "\n\n".join(blocks) + "\n\n\n" + body + "\n"
+
+
+def import_line(module, names):
+    """Import line, wrapped at 79 columns."""
+    lines = ["from {} import ".format(module)]
+    indent = " " * len(lines[0])
+    if len(lines[0] + ", ".join(names)) > 79:
+        lines[0] += "("
+        indent += " "
+        names = names[:-1] + [names[-1] + ")"]
+    for i, name in enumerate(names):
+        word = name + ("," if i < len(names) - 1 else "")
+        if len(lines[-1]) + len(word) + 1 > 79:
+            lines[-1] = lines[-1].rstrip()
+            lines.append(indent)
+        elif not lines[-1].endswith(("import ", "(")):
+            lines[-1] += " "
+        lines[-1] += word
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="+")
+    parser.add_argument("--write", action="store_true",
+                        help="rewrite the modules instead of printing them")
+    args = parser.parse_args(argv)
+    failed = False
+    for path in args.modules:
+        with open(path) as f:
+            source = f.read()
+        try:
+            converted = convert(source)
+        except (Unsupported, ValueError) as error:
+            sys.stderr.write("{}: {}\n".format(path, error))
+            failed = True
+            continue
+        if args.write:
+            with open(path, "w") as f:
+                f.write(converted)
+        else:
+            sys.stdout.write("# {}\n{}\n".format(path, converted))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""Suggest shorter drive base sequences for the mission programs.
+
+Usage::
+
+    python host/optimize.py mission_6.py Missions_8_5_9_and_10.py
+    python host/optimize.py --keep-reversals --tolerance 5 mission_6.py
+
+Each program is run in the simulator to collect its ``straight``, ``turn``
+and ``arc`` calls. Back-to-back moves with no other call in between are
+rewritten:
+
+* consecutive straights, or consecutive turns, become one move;
+* ``turn(a)``, ``straight(d)``, ``turn(b)`` becomes one ``arc``, or two
+  arcs that join smoothly, with the same end heading, if the end point
+  moves by less than the tolerance.
+
+Every change is timed on its own in the simulator and dropped unless it is
+faster; then the rewritten program is run to report the time saved and the
+end pose. The pass only knows kinematics: a reversal such as
+``straight(100)`` then ``straight(-180)`` usually pushes a model, so use
+``--keep-reversals`` to fuse only moves in the same direction, and check
+every suggestion on the table before changing a mission.
+"""
+
+import argparse
+import math
+
+import sim
+
+# Arcs tighter than this are close to a pivot turn and gain little.
+MIN_RADIUS = 50
+DEFAULT_TOLERANCE = 10
+
+
+class Change:
+    """Replacement of the consecutive calls ``calls`` by ``commands``."""
+
+    def __init__(self, calls, commands):
+        self.calls = calls
+        self.commands = commands
+
+    def describe(self):
+        lines = sorted({c.where for c in self.calls})
+        before = "; ".join(c.label.split(".", 1)[1] for c in self.calls)
+        after = "; ".join(fmt(c) for c in self.commands) or "nothing"
+        return "{:<28} {}  ->  {}".format(", ".join(lines), before, after)
+
+
+def fmt(command):
+    op = command[0]
+    if op == "arc":
+        _, radius, angle, distance = command
+        if distance is not None:
+            return "arc({}, distance={})".format(radius, distance)
+        return "arc({}, angle={})".format(radius, angle)
+    return "{}({})".format(op, command[1])
+
+
+def runs(result):
+    """Split the calls into runs of back-to-back blocking motions.
+
+    Any other call, a motion started with ``wait=False`` or a change of
+    mission function ends a run.
+    """
+    current = []
+    for call in result.calls:
+        motion = call.command is not None and call.duration > 0
+        if motion and current and current[-1].function == call.function:
+            current.append(call)
+            continue
+        if len(current) > 1:
+            yield current
+        current = [call] if motion else []
+    if len(current) > 1:
+        yield current
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+def _arc_end(pose, radius, angle):
+    """Pose after ``arc(radius, angle=angle)`` from ``pose``."""
+    x, y, h = pose
+    dh = angle * _sign(radius)
+    r = abs(radius) * _sign(radius)
+    h0, h1 = math.radians(h), math.radians(h + dh)
+    return (x + r * (math.sin(h1) - math.sin(h0)),
+            y - r * (math.cos(h1) - math.cos(h0)), h + dh)
+
+
+def _arc_to(pose, point):
+    """Forward arc from ``pose`` through ``point``, as ``(radius, angle)``."""
+    x, y, h = pose
+    bearing = math.degrees(math.atan2(point[1] - y, point[0] - x)) - h
+    bearing = (bearing + 180) % 360 - 180
+    turn = 2 * bearing
+    chord = math.hypot(point[0] - x, point[1] - y)
+    if abs(turn) < 1 or abs(turn) > 180:
+        return None
+    radius = chord / (2 * math.sin(math.radians(abs(turn)) / 2))
+    return int(round(radius)) * _sign(turn), int(round(abs(turn)))
+
+
+def _fits(commands, target, tolerance):
+    pose = (0.0, 0.0, 0.0)
+    for _, radius, angle, _ in commands:
+        if abs(radius) < MIN_RADIUS:
+            return False
+        pose = _arc_end(pose, radius, angle)
+    return (math.hypot(pose[0] - target[0], pose[1] - target[1]) <= tolerance
+            and abs(pose[2] - target[2]) < 0.5)
+
+
+def to_arcs(a, d, b, tolerance):
+    """Return arcs equivalent to turn(a), straight(d), turn(b), or None.
+
+    One arc is tried first. When that misses the end point, two arcs that
+    meet tangentially (a biarc) are tried for forward moves.
+    """
+    theta = a + b
+    if d == 0 or abs(theta) > 180:
+        return None
+    target = (d * math.cos(math.radians(a)), d * math.sin(math.radians(a)),
+              theta)
+    if abs(theta) >= 1:
+        # The chord of a single arc points halfway along the heading change.
+        off = math.radians(a - theta / 2)
+        chord = abs(d) * math.cos(off)
+        if chord > 0:
+            radius = chord / (2 * math.sin(math.radians(abs(theta)) / 2))
+            angle = _sign(d) * abs(theta)
+            arc = [("arc", int(round(radius)) * _sign(theta) * _sign(angle),
+                    angle, None)]
+            if _fits(arc, target, tolerance):
+                return arc
+    if d < 0:
+        return None
+    # Equal-length biarc between the start and end tangents.
+    vx, vy = target[0], target[1]
+    tx, ty = 1 + math.cos(math.radians(theta)), math.sin(math.radians(theta))
+    vt = vx * tx + vy * ty
+    vv = vx * vx + vy * vy
+    denom = 2 * (1 - math.cos(math.radians(theta)))
+    if denom < 1e-9:
+        if vx <= 0:
+            return None
+        k = vv / (4 * vx)
+    else:
+        k = (-vt + math.sqrt(vt * vt + denom * vv)) / denom
+    if k <= 0:
+        return None
+    h1 = math.radians(theta)
+    joint = ((k + vx - k * math.cos(h1)) / 2, (vy - k * math.sin(h1)) / 2)
+    first = _arc_to((0.0, 0.0, 0.0), joint)
+    if first is None:
+        return None
+    mid = _arc_end((0.0, 0.0, 0.0), *first)
+    second = _arc_to(mid, (vx, vy))
+    if second is None:
+        return None
+    # Make the headings add up exactly after rounding.
+    second = (second[0], int(round(abs(theta - mid[2]))))
+    arcs = [("arc", first[0], first[1], None),
+            ("arc", second[0], second[1], None)]
+    if _sign(theta - mid[2]) != _sign(second[0]) or not _fits(
+            arcs, target, tolerance):
+        return None
+    return arcs
+
+
+def simplify(calls, reversals=True, tolerance=DEFAULT_TOLERANCE):
+    """Return the Changes that shorten one run of motion calls."""
+    items = [([call], call.command) for call in calls]
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(items) - 1):
+            (src1, c1), (src2, c2) = items[i], items[i + 1]
+            if not isinstance(c1, tuple) or not isinstance(c2, tuple):
+                continue
+            if c1[0] != c2[0]:
+                continue
+            if c1[0] not in ("straight", "turn"):
+                continue
+            if not reversals and _sign(c1[1]) != _sign(c2[1]):
+                continue
+            total = c1[1] + c2[1]
+            merged = (c1[0], total) if total else None
+            items[i:i + 2] = [(src1 + src2, merged)]
+            changed = True
+            break
+        if changed:
+            continue
+        for i in range(len(items) - 2):
+            (s1, c1), (s2, c2), (s3, c3) = items[i:i + 3]
+            if not all(isinstance(c, tuple) for c in (c1, c2, c3)):
+                continue
+            if (c1[0], c2[0], c3[0]) != ("turn", "straight", "turn"):
+                continue
+            arcs = to_arcs(c1[1], c2[1], c3[1], tolerance)
+            if arcs is not None:
+                items[i:i + 3] = [(s1 + s2 + s3, arcs)]
+                changed = True
+                break
+    changes = []
+    for src, cmd in items:
+        if len(src) > 1:
+            if cmd is None or isinstance(cmd, list):
+                changes.append(Change(src, cmd or []))
+            else:
+                changes.append(Change(src, [cmd]))
+    return changes
+
+
+def optimize(result, reversals=True, tolerance=DEFAULT_TOLERANCE):
+    changes = []
+    for calls in runs(result):
+        changes += simplify(calls, reversals, tolerance)
+    return changes
+
+
+def faster(program, choices, changes, total):
+    """Keep the changes that make the simulated run shorter on their own."""
+    return [change for change in changes
+            if sim.run(program, choices, rewrite_for([change])).total < total]
+
+
+def rewrite_for(changes):
+    """Map motion numbers to replacement commands for ``sim.run``."""
+    rewrite = {}
+    for change in changes:
+        indexes = [call.index for call in change.calls]
+        for i, index in enumerate(indexes):
+            rewrite[index] = (change.commands[i]
+                              if i < len(change.commands) else None)
+    return rewrite
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("programs", nargs="+")
+    parser.add_argument("--choice", action="append",
+                        help="answer for hub_menu, may be repeated")
+    parser.add_argument("--keep-reversals", action="store_true",
+                        help="only fuse moves in the same direction")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="end point error allowed for an arc, in mm")
+    args = parser.parse_args(argv)
+
+    saved = 0
+    for program in args.programs:
+        before = sim.run(program, args.choice)
+        changes = optimize(before, not args.keep_reversals, args.tolerance)
+        changes = faster(program, args.choice, changes, before.total)
+        print("== {}".format(before.program))
+        if not changes:
+            print("  nothing to merge")
+            continue
+        for change in changes:
+            print("  " + change.describe())
+        after = sim.run(program, args.choice, rewrite_for(changes))
+        old, new = before.by_function(), after.by_function()
+        for function in old:
+            if new.get(function, 0) < old[function]:
+                print("  {:<30} saves {:6.2f} s".format(
+                    function, (old[function] - new.get(function, 0)) / 1000))
+        dx = after.pose[0] - before.pose[0]
+        dy = after.pose[1] - before.pose[1]
+        print("  {:.2f} s -> {:.2f} s, saves {:.2f} s; end pose off by "
+              "{:.0f} mm, {:.1f} deg".format(
+                  before.total / 1000, after.total / 1000,
+                  (before.total - after.total) / 1000, math.hypot(dx, dy),
+                  after.pose[2] - before.pose[2]))
+        saved += before.total - after.total
+    if len(args.programs) > 1:
+        print("all programs: saves {:.2f} s".format(saved / 1000))
+
+
+if __name__ == "__main__":
+    main()
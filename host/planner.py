@@ -0,0 +1,317 @@
+"""Plan the launches of a match: which missions to chain and in what order.
+
+Usage::
+
+    python host/planner.py
+    python host/planner.py --match 150 --emit .
+
+Every mission function in ``TASKS`` is run in the simulator to measure its
+duration and its start and end pose. The planner then searches all orders
+and groupings for the one that scores the most points within the match
+time, counting the handling time at base before every launch after the
+first. Missions run in one launch only if they use the same attachment (or
+none). Between chained missions the robot drives a turn, a straight and a
+turn, which the emitted programs drive with ``navigator.go_to`` to the
+next mission's start pose; at the end of a launch the robot drives back to
+base unless it is already there.
+
+With ``--emit`` a program is written for every launch that chains more than
+one mission, ready to be added to ``programs.py``. This is refused while
+the points and attachments in ``TASKS`` are still placeholders.
+"""
+
+import argparse
+import math
+import os
+import sys
+
+import sim
+from convert import import_line
+from pybricks import _sim
+
+# (program, mission function, expected points, attachment). The points are
+# what we expect to score, not the maximum on the scoring sheet; None as the
+# attachment means the mission needs none.
+#
+# The points and attachment names below are placeholders, not the team's
+# numbers, and they decide which missions are left out. Fill them in from
+# the scoring sheet and the robot, then set PLACEHOLDERS to False; until
+# then the plan is only an example and --emit is refused.
+PLACEHOLDERS = True
+TASKS = (
+    ("Missions_8_5_9_and_10.py", "Miission_8_and_5", 45, "silo arm"),
+    ("Missions_8_5_9_and_10.py", "Mission_9_Push_black_lever", 20, "silo arm"),
+    ("Missions_8_5_9_and_10.py", "Mission_10_Bucket_2", 20, "silo arm"),
+    ("mission_9_pull.py", "Missioon_9__Pull", 30, "hook"),
+    ("mission_10_pull.py", "mission_10_pull", 30, "hook"),
+    ("mission_6.py", "Mission_6___Forge", 30, None),
+    ("mission_7.py", "mission_7", 30, "lift arm"),
+    ("Mission1_2.py", "mission_1_2", 30, "brush"),
+    ("Mission1_3_13.py", "mission_1_3_13", 40, "statue arm"),
+    ("Mission_12.py", "mission_12", 30, "salvage arm"),
+)
+# Where each program is launched from, as field (x, y, heading) in mm and
+# degrees. Programs not listed start from (0, 0, 0).
+LAUNCH_POSES = {}
+
+MATCH_S = 150
+# Time at base to pick up the robot, place it and start the next program,
+# and the extra time when the attachment changes.
+RELAUNCH_MS = 4000
+SWAP_MS = 6000
+# A robot this close to its launch point counts as being in base.
+BASE_RADIUS = 250
+# Settings used to estimate the drive between missions.
+TRANSIT_SPEED = 400
+TRANSIT_ACCELERATION = 800
+TRANSIT_TURN_RATE = 300
+TRANSIT_TURN_ACCELERATION = 600
+
+
+class Task:
+    def __init__(self, program, function, points, attachment):
+        self.program = program
+        self.function = function
+        self.points = points
+        self.attachment = attachment
+        self.start = self.end = None
+        self.duration = 0
+
+    @property
+    def base(self):
+        return LAUNCH_POSES.get(self.program, (0, 0, 0))
+
+
+def to_field(base, pose):
+    bx, by, bh = base
+    x, y, h = pose
+    c, s = math.cos(math.radians(bh)), math.sin(math.radians(bh))
+    return bx + x * c - y * s, by + x * s + y * c, bh + h
+
+
+def from_field(base, pose):
+    """Inverse of ``to_field``: a field pose seen from ``base``."""
+    bx, by, bh = base
+    x, y, h = pose[0] - bx, pose[1] - by, pose[2]
+    c, s = math.cos(math.radians(bh)), math.sin(math.radians(bh))
+    return x * c + y * s, -x * s + y * c, h - bh
+
+
+def _wrap(angle):
+    return (angle + 180) % 360 - 180
+
+
+def transit(a, b, heading=True):
+    """Return ``(turn, straight, turn)`` from pose ``a`` to pose ``b``."""
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    distance = math.hypot(dx, dy)
+    if distance < 1:
+        return 0, 0, _wrap(b[2] - a[2]) if heading else 0
+    bearing = math.degrees(math.atan2(dy, dx))
+    first = _wrap(bearing - a[2])
+    # Back up instead of turning around.
+    if abs(first) > 90:
+        first = _wrap(first - 180)
+        distance = -distance
+    last = _wrap(b[2] - (a[2] + first)) if heading else 0
+    return first, distance, last
+
+
+def transit_ms(a, b, heading=True):
+    first, distance, last = transit(a, b, heading)
+    total = 0
+    for move, speed, acc in (
+            (first, TRANSIT_TURN_RATE, TRANSIT_TURN_ACCELERATION),
+            (distance, TRANSIT_SPEED, TRANSIT_ACCELERATION),
+            (last, TRANSIT_TURN_RATE, TRANSIT_TURN_ACCELERATION)):
+        if abs(move) >= 1:
+            total += _sim.Profile(0, 0, move, speed, acc).duration
+            total += _sim.SETTLE_MS
+    return total
+
+
+def measure(tasks):
+    """Fill in the start and end pose and the duration of every task."""
+    wanted = {}
+    for task in tasks:
+        wanted.setdefault(task.program, {})[task.function] = task
+
+    for program, functions in wanted.items():
+        def profile(frame, event, arg):
+            task = functions.get(frame.f_code.co_name)
+            if task is None or event not in ("call", "return"):
+                return
+            drive = _sim.state.drive
+            pose = drive.pose() if drive is not None else (0.0, 0.0, 0.0)
+            if event == "call":
+                task.start, task.duration = pose, -_sim.state.now
+            else:
+                task.end = pose
+                task.duration += _sim.state.now
+
+        sys.setprofile(profile)
+        try:
+            sim.run(program)
+        finally:
+            sys.setprofile(None)
+        for task in functions.values():
+            task.start = to_field(task.base, task.start)
+            task.end = to_field(task.base, task.end)
+
+
+def compatible(attachment, task):
+    return attachment is None or task.attachment in (None, attachment)
+
+
+def home_ms(task):
+    """Time to drive back to base after ``task``."""
+    base = task.base
+    if math.hypot(task.end[0] - base[0], task.end[1] - base[1]) <= BASE_RADIUS:
+        return 0
+    return transit_ms(task.end, base, heading=False)
+
+
+def plan(tasks, match_ms):
+    """Return ``(points, ms, launches)`` of the best plan.
+
+    ``launches`` is a list of lists of tasks. The search is exact: a dynamic
+    program over the set of missions done, the last one, and the attachment
+    on the robot.
+    """
+    n = len(tasks)
+    # best[(mask, last, attachment)] = (ms, previous state, new launch)
+    best = {}
+    for j, task in enumerate(tasks):
+        ms = transit_ms(task.base, task.start) + task.duration
+        if ms <= match_ms:
+            best[(1 << j, j, task.attachment)] = (ms, None, True)
+    # A state only leads to states with one more mission, so going by the
+    # number of missions done settles every state before it is extended.
+    for done in range(1, n):
+        layer = [s for s in best if bin(s[0]).count("1") == done]
+        for state in layer:
+            mask, last, attachment = state
+            ms = best[state][0]
+            for j, task in enumerate(tasks):
+                if mask & (1 << j):
+                    continue
+                options = []
+                if compatible(attachment, task):
+                    chained = (ms + transit_ms(tasks[last].end, task.start)
+                               + task.duration)
+                    options.append(
+                        (chained, attachment or task.attachment, False))
+                # The attachment stays on the robot through missions that
+                # need none, and is only swapped for a different one.
+                if compatible(attachment, task):
+                    swap, attached = 0, attachment or task.attachment
+                else:
+                    swap, attached = SWAP_MS, task.attachment
+                relaunch = (ms + home_ms(tasks[last]) + RELAUNCH_MS + swap
+                            + transit_ms(task.base, task.start)
+                            + task.duration)
+                options.append((relaunch, attached, True))
+                for total, attached, new in options:
+                    key = (mask | (1 << j), j, attached)
+                    if total <= match_ms and (
+                            key not in best or total < best[key][0]):
+                        best[key] = (total, state, new)
+    if not best:
+        return 0, 0, []
+
+    def score(state):
+        return sum(tasks[j].points for j in range(n) if state[0] & (1 << j))
+
+    final = max(best, key=lambda s: (score(s), -best[s][0]))
+    steps = []
+    state = final
+    while state is not None:
+        ms, previous, new = best[state]
+        steps.insert(0, (tasks[state[1]], new))
+        state = previous
+    launches = []
+    for task, new in steps:
+        if new:
+            launches.append([])
+        launches[-1].append(task)
+    return score(final), best[final][0], launches
+
+
+def emit(launches, directory):
+    """Write a program for every launch of more than one mission."""
+    written = []
+    for number, launch in enumerate(launches, 1):
+        if len(launch) < 2:
+            continue
+        name = "launch_{}".format(number)
+        imports = {"parallel": {"finish"}, "runtime": {"launch", "navigator"}}
+        for task in launch:
+            imports.setdefault(task.program[:-3], set()).add(task.function)
+        lines = [import_line(module, sorted(names))
+                 for module, names in sorted(imports.items())]
+        lines += ["", ""]
+        lines.append("def {}():".format(name))
+        base = launch[0].base
+        for i, task in enumerate(launch):
+            if i:
+                lines.append("    # Drive to the start of {}.".format(
+                    task.function))
+                lines.append(_go_to(
+                    base, launch[i - 1].end, task.start, heading=True))
+            lines.append("    {}()".format(task.function))
+        if home_ms(launch[-1]):
+            lines.append("    # Drive back to base.")
+            lines.append(_go_to(base, launch[-1].end, base, heading=False))
+        lines += ["    finish()", "", "", "# The main program starts here.",
+                  'if __name__ == "__main__":',
+                  "    launch({})".format(name)]
+        path = os.path.join(directory, name + ".py")
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        written.append(path)
+    return written
+
+
+def _go_to(base, start, end, heading):
+    """``navigator.go_to`` line from field pose ``start`` to ``end``."""
+    x, y, h = from_field(base, end)
+    args = [str(round(x)), str(round(y))]
+    if heading:
+        args.append(str(round(_wrap(h))))
+    if transit(start, end, heading)[1] < 0:
+        args.append("backwards=True")
+    return "    navigator.go_to({})".format(", ".join(args))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--match", type=float, default=MATCH_S,
+                        help="match time in seconds")
+    parser.add_argument("--emit", metavar="DIR",
+                        help="write programs for chained launches to DIR")
+    args = parser.parse_args(argv)
+    if args.emit and PLACEHOLDERS:
+        parser.error("the points and attachments in TASKS are placeholders; "
+                     "fill them in and set PLACEHOLDERS = False first")
+
+    tasks = [Task(*row) for row in TASKS]
+    measure(tasks)
+    points, ms, launches = plan(tasks, args.match * 1000)
+    for number, launch in enumerate(launches, 1):
+        names = ", ".join(task.function for task in launch)
+        print("launch {}: {}".format(number, names))
+    left = [t.function for t in tasks if not any(t in l for l in launches)]
+    if left:
+        print("left out: {}".format(", ".join(left)))
+    print("{} points in {:.1f} s of {:.0f} s".format(
+        points, ms / 1000, args.match))
+    if PLACEHOLDERS:
+        print("the points and attachments in TASKS are placeholders, so "
+              "this plan is only an example")
+    if args.emit:
+        for path in emit(launches, args.emit):
+            print("wrote {}".format(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""Host-side stand-in for the pybricks firmware modules.
+
+Only what the mission programs use is modelled. See ``_sim`` for the
+virtual clock and the motion model.
+"""
+
+version = ("host", "3.5.0", "host simulator")
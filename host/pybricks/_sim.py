@@ -0,0 +1,246 @@
+"""Shared state of the host-side pybricks stand-in.
+
+Everything runs on a virtual clock in milliseconds. Blocking commands
+advance the clock by the time their speed profile takes; commands started
+with ``wait=False`` keep moving while the clock is advanced by later calls.
+Every motion, settings and wait call is appended to ``calls`` so the runner
+can report where the time goes.
+"""
+
+import math
+import os
+import sys
+
+# Motor model. The SPIKE motors top out around 1000 deg/s; the default
+# acceleration and the extra time the controller needs to declare a
+# maneuver done are approximations, not measurements.
+MAX_SPEED = 1000
+DEFAULT_ACCELERATION = 2000
+SETTLE_MS = 30
+DEFAULT_STALL_TRAVEL = 180
+BATTERY_MV = 8000
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Shared program modules whose calls are charged to the mission calling them.
+LIBRARIES = {"calibration.py", "engine.py", "nav.py", "parallel.py",
+             "runtime.py", "strokes.py", "telemetry.py", "tuning.py",
+             "waits.py"}
+# The interpreter of mission tables.
+ENGINE = "engine.py"
+
+
+class Call:
+    """One recorded API call."""
+
+    def __init__(self, start, label, where, function):
+        self.start = start
+        self.end = start
+        self.label = label
+        self.where = where
+        self.function = function
+        # Drive base motion calls also keep the command and its number.
+        self.command = None
+        self.index = None
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+class State:
+    def __init__(self):
+        self.now = 0.0
+        self.calls = []
+        self.drive = None
+        self.motors = {}
+        self.imu_offset = 0.0
+        self.menu = None
+        self.battery_mv = BATTERY_MV
+        self.storage = bytearray(512)
+        self.motions = 0
+        self.rewrite = {}
+
+
+state = State()
+
+
+def reset(menu=None, rewrite=None):
+    """Start a fresh run.
+
+    ``menu`` is an optional list of ``hub_menu`` answers and ``rewrite``
+    replaces drive base motions, see ``DriveBase._command``.
+    """
+    global state
+    state = State()
+    state.menu = None if menu is None else list(menu)
+    state.rewrite = dict(rewrite or {})
+
+
+def now():
+    return state.now
+
+
+def advance(ms):
+    if ms > 0:
+        state.now += ms
+
+
+def caller():
+    """Return ``("file:line", function)`` of the mission code making a call.
+
+    Calls made by ``engine.run`` are placed at the line that runs the
+    table, followed by the step number in the table.
+    """
+    frame = sys._getframe(1)
+    step = None
+    while frame is not None:
+        path = os.path.abspath(frame.f_code.co_filename)
+        name = os.path.basename(path)
+        if name == ENGINE and "index" in frame.f_locals:
+            step = frame.f_locals["index"]
+        if not path.startswith(_HERE) and name not in LIBRARIES:
+            where = "{}:{}".format(name, frame.f_lineno)
+            if step is not None:
+                where += "#{}".format(step)
+            return where, frame.f_code.co_name
+        frame = frame.f_back
+    return "?", "?"
+
+
+def record(label):
+    """Append a call starting now; the caller sets ``end`` once it is known."""
+    where, function = caller()
+    call = Call(state.now, label, where, function)
+    state.calls.append(call)
+    return call
+
+
+def fmt_args(*args, **kwargs):
+    parts = [repr(a) for a in args]
+    parts += ["{}={!r}".format(k, v) for k, v in kwargs.items()
+              if v is not None]
+    return ", ".join(parts)
+
+
+class Profile:
+    """Trapezoidal position profile from ``x0`` moving at ``v0`` to ``target``.
+
+    The profile is a list of constant-acceleration phases. An initial speed
+    pointing away from the target, or too high to stop in time, is braked
+    first, as the pybricks trajectory generator does.
+    """
+
+    def __init__(self, x0, v0, target, speed, acceleration, deceleration=None):
+        self.x0 = x0
+        self.v0 = v0
+        self.phases = []
+        speed = abs(speed)
+        acc = abs(acceleration)
+        dec = abs(deceleration or acceleration)
+        x, v = x0, v0
+        for _ in range(4):
+            x, v, finished = self._plan(x, v, target, speed, acc, dec)
+            if finished:
+                break
+        self.duration = sum(t for t, _ in self.phases) * 1000
+
+    def _add(self, t, a, x, v):
+        if t > 0:
+            self.phases.append((t, a))
+        return x + v * t + a * t * t / 2, v + a * t
+
+    def _plan(self, x, v, target, speed, acc, dec):
+        dist = target - x
+        if abs(dist) < 1e-9 and abs(v) < 1e-9:
+            return x, 0.0, True
+        s = 1 if dist > 0 or (dist == 0 and v < 0) else -1
+        u = v * s
+        dist = abs(dist)
+        if u < 0:
+            x, v = self._add(-u / dec, dec * s, x, v)
+            return x, 0.0, False
+        if u * u / (2 * dec) > dist + 1e-9:
+            x, v = self._add(u / dec, -dec * s, x, v)
+            return x, 0.0, False
+        if speed <= 0:
+            return x, v, True
+        if u > speed:
+            x, v = self._add((u - speed) / dec, -dec * s, x, v)
+            u = speed
+            dist = abs(target - x)
+        peak = math.sqrt((2 * acc * dec * dist + dec * u * u) / (acc + dec))
+        peak = min(peak, speed)
+        t1 = (peak - u) / acc
+        d1 = (peak * peak - u * u) / (2 * acc)
+        t3 = peak / dec
+        d3 = peak * peak / (2 * dec)
+        t2 = max(dist - d1 - d3, 0) / peak if peak > 0 else 0
+        x, v = self._add(t1, acc * s, x, v)
+        x, v = self._add(t2, 0.0, x, v)
+        x, v = self._add(t3, -dec * s, x, v)
+        return target, 0.0, True
+
+    def at(self, ms):
+        """Return ``(position, speed)`` ``ms`` after the profile started."""
+        t = max(ms, 0) / 1000
+        x, v = self.x0, self.v0
+        for dt, a in self.phases:
+            step = min(t, dt)
+            x += v * step + a * step * step / 2
+            v += a * step
+            t -= step
+            if t <= 0:
+                break
+        return x, v
+
+
+class Move:
+    """A profile started at a point on the virtual clock."""
+
+    def __init__(self, profile, settle=SETTLE_MS):
+        self.start = state.now
+        self.profile = profile
+        self.end = self.start + profile.duration + settle
+
+    def at(self):
+        return self.at_elapsed(state.now - self.start)
+
+    def at_elapsed(self, ms):
+        return self.profile.at(ms)
+
+    def done(self):
+        return state.now >= self.end
+
+    def finish(self, call):
+        """Block until the move is complete and close the recorded call."""
+        advance(self.end - state.now)
+        call.end = state.now
+
+
+class Run:
+    """Constant-speed motion that never finishes on its own."""
+
+    def __init__(self, x0, v0, speed, acceleration):
+        self.start = state.now
+        self.x0 = x0
+        self.v0 = v0
+        self.speed = speed
+        self.acceleration = abs(acceleration)
+        self.end = float("inf")
+
+    def at(self):
+        return self.at_elapsed(state.now - self.start)
+
+    def at_elapsed(self, ms):
+        t = max(ms, 0) / 1000
+        dv = self.speed - self.v0
+        ramp = abs(dv) / self.acceleration if self.acceleration else 0
+        a = math.copysign(self.acceleration, dv) if dv else 0
+        if t <= ramp:
+            return self.x0 + self.v0 * t + a * t * t / 2, self.v0 + a * t
+        x = self.x0 + self.v0 * ramp + a * ramp * ramp / 2
+        return x + self.speed * (t - ramp), self.speed
+
+    def done(self):
+        return False
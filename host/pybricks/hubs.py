@@ -0,0 +1,112 @@
+"""Simulated ``pybricks.hubs.PrimeHub``."""
+
+from . import _sim
+from .parameters import Side
+
+
+class _IMU:
+    def heading(self):
+        drive = _sim.state.drive
+        h = drive.pose()[2] if drive is not None else 0.0
+        return h - _sim.state.imu_offset
+
+    def reset_heading(self, angle):
+        _sim.state.imu_offset = self.heading() + _sim.state.imu_offset - angle
+
+    def ready(self):
+        return True
+
+    def stationary(self):
+        drive = _sim.state.drive
+        return drive is None or drive.done()
+
+    def up(self, calibrated=True):
+        return Side.TOP
+
+    def tilt(self, calibrated=True):
+        return 0, 0
+
+    def acceleration(self, *args, **kwargs):
+        return 0, 0, 9810
+
+    def angular_velocity(self, *args, **kwargs):
+        drive = _sim.state.drive
+        rate = drive.state()[3] if drive is not None else 0
+        return 0, 0, -rate
+
+    def settings(self, *args, **kwargs):
+        pass
+
+
+class _Battery:
+    def voltage(self):
+        return _sim.state.battery_mv
+
+    def current(self):
+        return 200
+
+
+class _System:
+    def storage(self, offset, read=None, write=None):
+        data = _sim.state.storage
+        if write is not None:
+            data[offset:offset + len(write)] = write
+            return None
+        return bytes(data[offset:offset + read])
+
+    def set_stop_button(self, button):
+        pass
+
+    def name(self):
+        return "Pybricks Hub"
+
+    def shutdown(self):
+        raise SystemExit
+
+
+class _Light:
+    def on(self, color):
+        pass
+
+    def off(self):
+        pass
+
+    def blink(self, color, durations):
+        pass
+
+    def animate(self, colors, interval):
+        pass
+
+
+class _Display:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _Speaker:
+    def volume(self, volume=None):
+        return 100 if volume is None else None
+
+    def beep(self, frequency=500, duration=100):
+        _sim.advance(duration)
+
+    def play_notes(self, notes, tempo=120):
+        _sim.advance(len(notes) * 60000 / tempo / 4)
+
+
+class _Buttons:
+    def pressed(self):
+        return set()
+
+
+class PrimeHub:
+    def __init__(self, top_side=Side.TOP, front_side=Side.FRONT,
+                 broadcast_channel=None, observe_channels=()):
+        self.imu = _IMU()
+        self.battery = _Battery()
+        self.system = _System()
+        self.light = _Light()
+        self.display = _Display()
+        self.speaker = _Speaker()
+        self.buttons = _Buttons()
+        self.charger = None
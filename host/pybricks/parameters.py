@@ -0,0 +1,38 @@
+"""Constants from ``pybricks.parameters``."""
+
+
+class _Constant:
+    def __init__(self, owner, name, value=None):
+        self.owner = owner
+        self.name = name
+        self.value = value
+
+    def __repr__(self):
+        return "{}.{}".format(self.owner, self.name)
+
+
+def _enum(owner, *names):
+    cls = type(owner, (), {})
+    for value, name in enumerate(names):
+        setattr(cls, name, _Constant(owner, name, value))
+    return cls
+
+
+Port = _enum("Port", "A", "B", "C", "D", "E", "F")
+Stop = _enum("Stop", "COAST", "BRAKE", "HOLD", "NONE", "COAST_SMART")
+Button = _enum("Button", "LEFT", "RIGHT", "CENTER", "BLUETOOTH")
+Axis = _enum("Axis", "X", "Y", "Z")
+Side = _enum("Side", "TOP", "BOTTOM", "FRONT", "BACK", "LEFT", "RIGHT")
+Color = _enum(
+    "Color", "NONE", "BLACK", "GRAY", "WHITE", "RED", "ORANGE", "BROWN",
+    "YELLOW", "GREEN", "CYAN", "BLUE", "VIOLET", "MAGENTA",
+)
+Icon = _enum(
+    "Icon", "UP", "DOWN", "LEFT", "RIGHT", "HAPPY", "SAD", "HEART", "TRUE",
+    "FALSE", "PAUSE", "EMPTY", "FULL", "SQUARE", "TRIANGLE", "CIRCLE",
+)
+
+
+class Direction:
+    CLOCKWISE = _Constant("Direction", "CLOCKWISE", 1)
+    COUNTERCLOCKWISE = _Constant("Direction", "COUNTERCLOCKWISE", -1)
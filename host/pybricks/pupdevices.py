@@ -0,0 +1,212 @@
+"""Simulated ``pybricks.pupdevices`` motors."""
+
+import math
+
+from . import _sim
+from .parameters import Color, Direction, Stop
+
+
+class Control:
+    """Speed and acceleration limits shared by a motor or drive base axis."""
+
+    def __init__(self, speed, acceleration, torque=560):
+        self._speed = speed
+        self._acceleration = acceleration
+        self._torque = torque
+        self.owner = None
+
+    def limits(self, speed=None, acceleration=None, torque=None):
+        if speed is None and acceleration is None and torque is None:
+            return self._speed, self._acceleration, self._torque
+        _sim.record("{}.control.limits({})".format(
+            self.owner, _sim.fmt_args(speed=speed, acceleration=acceleration,
+                                      torque=torque)))
+        if speed is not None:
+            self._speed = abs(speed)
+        if acceleration is not None:
+            self._acceleration = acceleration
+        if torque is not None:
+            self._torque = torque
+
+    def accelerations(self):
+        """Return ``(acceleration, deceleration)``."""
+        if isinstance(self._acceleration, (tuple, list)):
+            return abs(self._acceleration[0]), abs(self._acceleration[1])
+        return abs(self._acceleration), abs(self._acceleration)
+
+    def pid(self, *args, **kwargs):
+        if not args and not kwargs:
+            return 0, 0, 0, 0, 0
+
+    def target_tolerances(self, speed=None, position=None):
+        if speed is None and position is None:
+            return 50, 10
+
+    def stall_tolerances(self, speed=None, time=None):
+        if speed is None and time is None:
+            return 20, 200
+
+    def done(self):
+        return self.owner.done()
+
+    def stalled(self):
+        return self.owner.stalled()
+
+
+class Motor:
+    def __init__(self, port, positive_direction=Direction.CLOCKWISE,
+                 gears=None, reset_angle=True, profile=None):
+        self.port = port
+        self.positive_direction = positive_direction
+        self.control = Control(_sim.MAX_SPEED, _sim.DEFAULT_ACCELERATION)
+        self.control.owner = self
+        self._x = 0.0
+        self._move = None
+        self._offset = 0.0
+        self._stalled = False
+        self._drive = None
+        self._side = 0
+        _sim.state.motors[port.name] = self
+
+    def __repr__(self):
+        return "Motor({})".format(self.port.name)
+
+    # Measurements.
+
+    def _position(self):
+        if self._drive is not None:
+            mm = self._drive._wheel_travel(self._side)
+            return mm * 360 / (math.pi * self._drive.wheel_diameter)
+        if self._move is None:
+            return self._x
+        return self._move.at()[0]
+
+    def angle(self):
+        return int(round(self._position() - self._offset))
+
+    def speed(self, window=100):
+        if self._drive is not None:
+            mm = self._drive._wheel_speed(self._side)
+            return int(mm * 360 / (math.pi * self._drive.wheel_diameter))
+        if self._move is None or self._move.done():
+            return 0
+        return int(self._move.at()[1])
+
+    def load(self):
+        return 0
+
+    def stalled(self):
+        return self._stalled and self.done()
+
+    def done(self):
+        if self._drive is not None:
+            return self._drive.done()
+        return self._move is None or self._move.done()
+
+    def reset_angle(self, angle=None):
+        # Recorded, so optimize.py does not merge moves across it.
+        _sim.record("{}.reset_angle({})".format(self, _sim.fmt_args(angle)))
+        self._offset = self._position() - (0 if angle is None else angle)
+
+    # Commands.
+
+    def _commit(self):
+        """Freeze the current position and return ``(position, speed)``."""
+        if self._move is None:
+            return self._x, 0.0
+        x, v = self._move.at()
+        if self._move.done():
+            v = 0.0
+        self._x = x
+        self._move = None
+        return x, v
+
+    def _limits(self, speed):
+        acc, dec = self.control.accelerations()
+        return min(abs(speed), self.control._speed, _sim.MAX_SPEED), acc, dec
+
+    def _run_to(self, label, speed, target, wait, settle=_sim.SETTLE_MS):
+        call = _sim.record("{}.{}".format(self, label))
+        self._stalled = False
+        x, v = self._commit()
+        speed, acc, dec = self._limits(speed)
+        self._move = _sim.Move(
+            _sim.Profile(x, v, target + self._offset, speed, acc, dec), settle)
+        if wait:
+            self._move.finish(call)
+
+    def run_angle(self, speed, rotation_angle, then=Stop.HOLD, wait=True):
+        x = self._position() - self._offset
+        sign = -1 if (speed < 0) != (rotation_angle < 0) else 1
+        self._run_to(
+            "run_angle({})".format(_sim.fmt_args(speed, rotation_angle)),
+            speed, x + sign * abs(rotation_angle), wait)
+
+    def run_target(self, speed, target_angle, then=Stop.HOLD, wait=True):
+        self._run_to(
+            "run_target({})".format(_sim.fmt_args(speed, target_angle)),
+            speed, target_angle, wait)
+
+    def run_time(self, speed, time, then=Stop.HOLD, wait=True):
+        peak, acc, _ = self._limits(speed)
+        ramp = peak / acc
+        if time / 1000 >= 2 * ramp:
+            travel = peak * (time / 1000 - ramp)
+        else:
+            peak = acc * time / 2000
+            travel = peak * time / 2000
+        x = self._position() - self._offset
+        self._run_to(
+            "run_time({})".format(_sim.fmt_args(speed, time)),
+            speed, x + math.copysign(travel, speed), wait)
+
+    def run_until_stalled(self, speed, then=Stop.COAST, duty_limit=None):
+        x = self._position() - self._offset
+        self._run_to(
+            "run_until_stalled({})".format(_sim.fmt_args(speed)), speed,
+            x + math.copysign(_sim.DEFAULT_STALL_TRAVEL, speed), True,
+            settle=200)
+        self._stalled = True
+        return self.angle()
+
+    def run(self, speed):
+        _sim.record("{}.run({})".format(self, _sim.fmt_args(speed)))
+        self._stalled = False
+        x, v = self._commit()
+        limit, acc, _ = self._limits(speed)
+        self._move = _sim.Run(x, v, math.copysign(limit, speed), acc)
+
+    def dc(self, duty):
+        self.run(_sim.MAX_SPEED * duty / 100)
+
+    def track_target(self, target_angle):
+        self._commit()
+        self._x = target_angle + self._offset
+
+    def stop(self):
+        self._commit()
+
+    brake = stop
+    hold = stop
+
+    def close(self):
+        self._commit()
+
+
+class ColorSensor:
+    """Color sensor that always sees a white mat."""
+
+    def __init__(self, port):
+        self.port = port
+
+    def reflection(self):
+        return 100
+
+    def color(self, surface=True):
+        return Color.WHITE
+
+    def hsv(self, surface=True):
+        return 0, 0, 100
+
+    def ambient(self):
+        return 0
@@ -0,0 +1,277 @@
+"""Simulated ``pybricks.robotics.DriveBase``.
+
+The pose is kept in field coordinates relative to where the program
+started: ``x`` is forward, ``y`` is to the right and the heading is in
+degrees, clockwise positive, matching the pybricks sign conventions.
+"""
+
+import math
+
+from . import _sim
+from .parameters import Stop
+from .pupdevices import Control
+
+# Default settings are about 40% of the top wheel speed, as on the hub.
+DEFAULT_FRACTION = 0.4
+# Time it takes to reach the default speed from standstill, in seconds.
+DEFAULT_RAMP = 0.5
+# Step used to integrate free driving started with drive().
+DRIVE_STEP_MS = 10
+
+
+class DriveBase:
+    def __init__(self, left_motor, right_motor, wheel_diameter, axle_track):
+        self.left = left_motor
+        self.right = right_motor
+        self.wheel_diameter = wheel_diameter
+        self.axle_track = axle_track
+        left_motor._drive, left_motor._side = self, 1
+        right_motor._drive, right_motor._side = self, -1
+
+        self.max_speed = _sim.MAX_SPEED * math.pi * wheel_diameter / 360
+        self.max_turn_rate = math.degrees(self.max_speed / (axle_track / 2))
+        speed = DEFAULT_FRACTION * self.max_speed
+        rate = DEFAULT_FRACTION * self.max_turn_rate
+        self._settings = [
+            int(speed), int(speed / DEFAULT_RAMP),
+            int(rate), int(rate / DEFAULT_RAMP),
+        ]
+        self.distance_control = Control(self.max_speed, self._settings[1])
+        self.distance_control.owner = self
+        self.heading_control = Control(self.max_turn_rate, self._settings[3])
+        self.heading_control.owner = self
+
+        # Pose when the current motion started, and that motion.
+        self._x = self._y = self._h = self._s = 0.0
+        self._motion = None
+        self._distance_offset = 0.0
+        self._angle_offset = 0.0
+        self._gyro = False
+        _sim.state.drive = self
+
+    def __repr__(self):
+        return "DriveBase"
+
+    # Pose bookkeeping.
+
+    def _now(self):
+        """Return ``(x, y, heading, path, speed, turn_rate)`` at the clock."""
+        m = self._motion
+        if m is None:
+            return self._x, self._y, self._h, self._s, 0.0, 0.0
+        kind, s_move, h_move, k = m
+        if kind == "turn":
+            a, w = h_move.at()
+            if h_move.done():
+                w = 0.0
+            return self._x, self._y, self._h + a, self._s, 0.0, w
+        if kind == "drive":
+            return self._integrate(s_move, h_move)
+        s, v = s_move.at()
+        if s_move.done():
+            v = 0.0
+        x, y, h = self._along(s, k)
+        return x, y, h, self._s + s, v, k * v
+
+    def _along(self, s, k):
+        """Pose after ``s`` mm along a path of curvature ``k`` deg/mm."""
+        h0 = math.radians(self._h)
+        if abs(k) < 1e-12:
+            return (self._x + s * math.cos(h0), self._y + s * math.sin(h0),
+                    self._h)
+        h = self._h + k * s
+        r = 1 / math.radians(k)
+        h1 = math.radians(h)
+        return (self._x + r * (math.sin(h1) - math.sin(h0)),
+                self._y - r * (math.cos(h1) - math.cos(h0)), h)
+
+    def _integrate(self, s_move, h_move):
+        x, y, h = self._x, self._y, self._h
+        elapsed = _sim.state.now - s_move.start
+        t, s_prev, a_prev = 0.0, 0.0, 0.0
+        while t < elapsed:
+            t = min(t + DRIVE_STEP_MS, elapsed)
+            s, v = s_move.at_elapsed(t)
+            a, w = h_move.at_elapsed(t)
+            mid = math.radians(self._h + (a + a_prev) / 2)
+            x += (s - s_prev) * math.cos(mid)
+            y += (s - s_prev) * math.sin(mid)
+            s_prev, a_prev = s, a
+        s, v = s_move.at()
+        a, w = h_move.at()
+        return x, y, self._h + a, self._s + s, v, w
+
+    def _commit(self):
+        """Freeze the pose at the clock and return ``(speed, turn_rate)``."""
+        x, y, h, s, v, w = self._now()
+        self._x, self._y, self._h, self._s = x, y, h, s
+        self._motion = None
+        return v, w
+
+    def _wheel_travel(self, side):
+        _, _, h, s, _, _ = self._now()
+        return s + side * self.axle_track / 2 * math.radians(h)
+
+    def _wheel_speed(self, side):
+        _, _, _, _, v, w = self._now()
+        return v + side * self.axle_track / 2 * math.radians(w)
+
+    def _place(self):
+        """Put the robot back at the start position, as between launches."""
+        self._commit()
+        self._x = self._y = self._h = 0.0
+        self._angle_offset = 0.0
+        _sim.state.imu_offset = 0.0
+
+    def pose(self):
+        """Return ``(x, y, heading)`` since the start of the program."""
+        x, y, h, _, _, _ = self._now()
+        return x, y, h
+
+    # Measurements.
+
+    def distance(self):
+        return int(round(self._now()[3] - self._distance_offset))
+
+    def angle(self):
+        return self._now()[2] - self._angle_offset
+
+    def state(self):
+        _, _, h, s, v, w = self._now()
+        return (int(round(s - self._distance_offset)), int(v),
+                h - self._angle_offset, int(w))
+
+    def done(self):
+        m = self._motion
+        if m is None:
+            return True
+        return all(move is None or move.done() for move in m[1:3])
+
+    def stalled(self):
+        return False
+
+    # Configuration.
+
+    def settings(self, straight_speed=None, straight_acceleration=None,
+                 turn_rate=None, turn_acceleration=None):
+        values = (straight_speed, straight_acceleration, turn_rate,
+                  turn_acceleration)
+        if all(v is None for v in values):
+            return tuple(self._settings)
+        _sim.record("DriveBase.settings({})".format(_sim.fmt_args(
+            straight_speed=straight_speed,
+            straight_acceleration=straight_acceleration,
+            turn_rate=turn_rate, turn_acceleration=turn_acceleration)))
+        for i, value in enumerate(values):
+            if value is not None:
+                self._settings[i] = value
+
+    def use_gyro(self, use_gyro):
+        self._commit()
+        self._gyro = use_gyro
+
+    def reset(self, distance=0, angle=0):
+        _sim.record("DriveBase.reset({})".format(
+            _sim.fmt_args(distance, angle)))
+        self._commit()
+        self._distance_offset = self._s - distance
+        self._angle_offset = self._h - angle
+        if self._gyro:
+            _sim.state.imu_offset = self._h - angle
+
+    # Commands.
+
+    @staticmethod
+    def _pair(value):
+        if isinstance(value, (tuple, list)):
+            return abs(value[0]), abs(value[1])
+        return abs(value), abs(value)
+
+    def _start(self, label, kind, length, speed, acceleration, k, wait):
+        call = _sim.record("DriveBase.{}".format(label))
+        moving = self._motion is not None and self._motion[0] == kind
+        v, w = self._commit()
+        v0 = (w if kind == "turn" else v) if moving else 0.0
+        acc, dec = self._pair(acceleration)
+        move = _sim.Move(_sim.Profile(0.0, v0, length, speed, acc, dec))
+        if kind == "turn":
+            self._motion = (kind, None, move, 0.0)
+        else:
+            self._motion = (kind, move, None, k)
+        if wait:
+            move.finish(call)
+        return call
+
+    def _command(self, command, wait):
+        """Run a motion command, or its replacement if a rewrite is active.
+
+        Commands are ``("straight", distance)``, ``("turn", angle)`` and
+        ``("arc", radius, angle, distance)``. They are numbered in the order
+        the program gives them; ``state.rewrite`` maps such a number to the
+        command to run instead, or to ``None`` to skip it.
+        """
+        index = _sim.state.motions
+        _sim.state.motions += 1
+        if index in _sim.state.rewrite:
+            command = _sim.state.rewrite[index]
+            if command is None:
+                return
+        op = command[0]
+        if op == "straight":
+            speed = min(abs(self._settings[0]), self.max_speed)
+            call = self._start(
+                "straight({})".format(_sim.fmt_args(command[1])),
+                "path", command[1], speed, self._settings[1], 0.0, wait)
+        elif op == "turn":
+            rate = min(abs(self._settings[2]), self.max_turn_rate)
+            call = self._start("turn({})".format(_sim.fmt_args(command[1])),
+                               "turn", command[1], rate, self._settings[3],
+                               0.0, wait)
+        else:
+            _, radius, angle, distance = command
+            length = distance
+            if length is None:
+                length = math.radians(angle) * abs(radius)
+            # Curve to the right for a positive radius when driving forward.
+            k = math.degrees(1 / radius)
+            speed = min(abs(self._settings[0]), self.max_speed,
+                        math.radians(abs(self._settings[2])) * abs(radius))
+            label = "arc({})".format(
+                _sim.fmt_args(radius, angle=angle, distance=distance))
+            call = self._start(label, "path", length, speed,
+                               self._settings[1], k, wait)
+        call.command = command
+        call.index = index
+
+    def straight(self, distance, then=Stop.HOLD, wait=True):
+        self._command(("straight", distance), wait)
+
+    def turn(self, angle, then=Stop.HOLD, wait=True):
+        self._command(("turn", angle), wait)
+
+    def arc(self, radius, angle=None, distance=None, then=Stop.HOLD,
+            wait=True):
+        if (angle is None) == (distance is None) or radius == 0:
+            raise ValueError("give angle or distance, and a nonzero radius")
+        self._command(("arc", radius, angle, distance), wait)
+
+    def curve(self, radius, angle, then=Stop.HOLD, wait=True):
+        self.arc(radius, angle=angle, then=then, wait=wait)
+
+    def drive(self, speed, turn_rate):
+        _sim.record("DriveBase.drive({})".format(
+            _sim.fmt_args(speed, turn_rate)))
+        moving = self._motion is not None and self._motion[0] == "drive"
+        v, w = self._commit()
+        if not moving:
+            v = w = 0.0
+        acc, _ = self._pair(self._settings[1])
+        turn_acc, _ = self._pair(self._settings[3])
+        self._motion = ("drive", _sim.Run(0.0, v, speed, acc),
+                        _sim.Run(0.0, w, turn_rate, turn_acc), 0.0)
+
+    def stop(self):
+        self._commit()
+
+    brake = stop
+    hold = stop
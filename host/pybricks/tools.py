@@ -0,0 +1,53 @@
+"""Simulated ``pybricks.tools``."""
+
+from . import _sim
+
+
+def wait(time):
+    call = _sim.record("wait({})".format(_sim.fmt_args(time)))
+    _sim.advance(time)
+    call.end = _sim.now()
+
+
+class StopWatch:
+    def __init__(self):
+        self._start = _sim.now()
+        self._paused = None
+
+    def time(self):
+        now = _sim.now() if self._paused is None else self._paused
+        return int(now - self._start)
+
+    def pause(self):
+        if self._paused is None:
+            self._paused = _sim.now()
+
+    def resume(self):
+        if self._paused is not None:
+            self._start += _sim.now() - self._paused
+            self._paused = None
+
+    def reset(self):
+        self._start = _sim.now()
+        if self._paused is not None:
+            self._paused = self._start
+
+
+def hub_menu(*symbols):
+    """Answer from the runner's list of choices, else pick the first symbol.
+
+    Raises ``SystemExit`` once a given list of choices is used up, which is
+    how a menu that loops forever ends in the simulator. The robot is taken
+    to be back at its start position whenever the menu shows.
+    """
+    menu = _sim.state.menu
+    if menu is not None and not menu:
+        raise SystemExit
+    if _sim.state.drive is not None:
+        _sim.state.drive._place()
+    if menu is None:
+        return symbols[0]
+    choice = menu.pop(0)
+    if choice not in symbols:
+        raise ValueError("{!r} is not one of {!r}".format(choice, symbols))
+    return choice
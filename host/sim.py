@@ -0,0 +1,115 @@
+"""Run mission programs on the host against the simulated pybricks.
+
+Usage::
+
+    python host/sim.py mission_6.py
+    python host/sim.py --calls mission_7.py Mission1_3_13.py
+    python host/sim.py --choice D Menu.py
+
+The mission files are imported unmodified. The report gives the simulated
+time of every motion, settings and wait call, the total run time and the
+final pose of the drive base (``x`` forward, ``y`` right, heading clockwise,
+relative to where the program started).
+"""
+
+import argparse
+import os
+import runpy
+import sys
+
+HOST = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HOST)
+
+if HOST not in sys.path:
+    sys.path.insert(0, HOST)
+if ROOT not in sys.path:
+    sys.path.insert(1, ROOT)
+
+from pybricks import _sim  # noqa: E402
+
+MATCH_MS = 150000
+
+
+class Result:
+    """Outcome of one simulated program run."""
+
+    def __init__(self, program, calls, total, pose):
+        self.program = program
+        self.calls = calls
+        self.total = total
+        self.pose = pose
+
+    def by_function(self):
+        """Return ``{function: ms}`` of the blocking time per function."""
+        totals = {}
+        for call in self.calls:
+            totals[call.function] = (totals.get(call.function, 0)
+                                     + call.duration)
+        return totals
+
+
+def _forget_programs():
+    """Drop program modules so the next import runs them from the top."""
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None) or ""
+        if os.path.dirname(os.path.abspath(path)) == ROOT:
+            del sys.modules[name]
+
+
+def run(program, choices=None, rewrite=None):
+    """Run ``program`` (a path or a file name in the repo) and return a Result.
+
+    ``choices`` answers successive ``hub_menu`` calls; the run ends when they
+    are used up. ``rewrite`` replaces drive base motions by their number.
+    """
+    path = program if os.path.exists(program) else os.path.join(ROOT, program)
+    _forget_programs()
+    _sim.reset(choices, rewrite)
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit:
+        pass
+    state = _sim.state
+    pose = state.drive.pose() if state.drive is not None else (0.0, 0.0, 0.0)
+    return Result(os.path.basename(path), state.calls, state.now, pose)
+
+
+def report(result, calls=False, out=sys.stdout):
+    write = out.write
+    write("== {}\n".format(result.program))
+    if calls:
+        write("{:>8} {:>7}  {:<26} {}\n".format(
+            "start", "ms", "where", "call"))
+        for call in result.calls:
+            write("{:8.0f} {:7.0f}  {:<26} {}\n".format(
+                call.start, call.duration,
+                "{} {}".format(call.where, call.function), call.label))
+    for function, ms in sorted(result.by_function().items(),
+                               key=lambda item: -item[1]):
+        write("  {:<30} {:8.0f} ms\n".format(function, ms))
+    x, y, heading = result.pose
+    write("  total {:.2f} s ({:.0%} of the match), final pose "
+          "x={:.0f} mm y={:.0f} mm heading={:.1f} deg\n".format(
+              result.total / 1000, result.total / MATCH_MS, x, y, heading))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("programs", nargs="+")
+    parser.add_argument("--choice", action="append",
+                        help="answer for hub_menu, may be repeated")
+    parser.add_argument("--calls", action="store_true",
+                        help="list every call, not just the totals per "
+                        "function")
+    args = parser.parse_args(argv)
+    total = 0
+    for program in args.programs:
+        result = run(program, args.choice)
+        report(result, calls=args.calls)
+        total += result.total
+    if len(args.programs) > 1:
+        print("all programs: {:.2f} s".format(total / 1000))
+
+
+if __name__ == "__main__":
+    main()
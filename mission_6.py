@@ -1,38 +1,32 @@
-# pybricks blocks file:{"blocks":{"languageVersion":0,"blocks":[{"type":"blockGlobalSetup","id":"bjK,wS1MYO7aiYkFSwd{","x":63,"y":-19,"deletable":false,"next":{"block":{"type":"variables_set_prime_hub","id":"TOr[Y*p6lW/mk5ydzJ#@","extraState":{"optionLevel":0},"fields":{"VAR":{"id":"sNUcHq,4GbT0i33*%t,)"}},"next":{"block":{"type":"variables_set_motor","id":"J!fB%D37_bqds/yFx|Fk","fields":{"VAR":{"id":"`#(M;o4ZYJq8tDB[iZ?C"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"E:Toyf{|mW=_v|M,+o#=","fields":{"NAME":"C"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"mD8,(?-*+k8i0TKR]l,I","fields":{"SELECTION":"Direction.CLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"c!**t.gxCHJ4LNA!#hV{","fields":{"VAR":{"id":"Lb2},;H,NK3nY.@}-|9Z"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"oq$BVRUy8pUk+ulh#f7t","fields":{"NAME":"A"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"-(#8@OYHXhZt3^%G%PpB","fields":{"SELECTION":"Direction.COUNTERCLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"I;4yUi/,t,,__sRwxa-y","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"D0(|}9QKM$)zV@z|qc6U","fields":{"NAME":"B"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"4~-/nZ)^|$H6@g7oUJNA","fields":{"SELECTION":"Direction.CLOCKWISE"}}}},"next":{"block":{"type":"variables_set_drive_base","id":"(x=A|9k8X4?x9gd`kQFd","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??"}},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"+Z3N6A:Gsmr:4{_=e~.A","fields":{"VAR":{"id":"Lb2},;H,NK3nY.@}-|9Z","name":"left","type":"Motor"}}}},"VAR2":{"shadow":{"type":"variables_get_motor_device","id":"_`b.pWp2?1y,=*gjul:v","fields":{"VAR":{"id":"`#(M;o4ZYJq8tDB[iZ?C","name":"right","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_distance","id":"jvAHBV:=ex69.!zu)Qk#","fields":{"VALUE0":56}}},"VALUE1":{"shadow":{"type":"unit_distance","id":"U]{pA$:ON}LxCi8cKzrc","fields":{"VALUE0":80}}}}}}}}}}}}}}},{"type":"blockGlobalStart","id":"3tJe|AWl0baN(wH9a$@.","x":-76,"y":338,"deletable":false,"next":{"block":{"type":"blockDriveBaseUseGyro","id":"(:DT/*A7MqXWi;p9Y~~E","fields":{"METHOD":"DRIVEBASE_USE_GYRO_TRUE"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"0hc#EhoI8T}JNPV9P?^1","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}}},"next":{"block":{"type":"blockDriveBaseResetWithValues","id":"uy{47KXe?jUIt[+H?^Yx","inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"CmZEWY,qv)5~=qh@pJc8","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"VALUE0":{"shadow":{"type":"unit_distance","id":"){g;?4c#g8_O]n5Lf]LZ","fields":{"VALUE0":0}}},"VALUE1":{"shadow":{"type":"unit_angle","id":"YQI[!)JwMTj;`)S1%;Iy","fields":{"VALUE0":0}}}},"next":{"block":{"type":"blockMotorResetAngle","id":"IFlqJrKL^9z/PrhNx6j]","inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"aj)8,e#y@fK,EJt%H*^2","fields":{"VAR":{"id":"Lb2},;H,NK3nY.@}-|9Z","name":"left","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angle","id":"|conOpE5*x?,Pm;8Sic2","fields":{"VALUE0":0}}}},"next":{"block":{"type":"blockFunctionCallerStatement","id":"CDC=G@E~#~srzw4k1|},","extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"q^N#pJB!0_J@T5th@}q7"}}}}}}}}}}},{"type":"variables_setup_function","id":"gkVR}ZA=W]F/wK5hR6ZW","x":11,"y":654,"extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"q^N#pJB!0_J@T5th@}q7"}},"inputs":{"STACK":{"block":{"type":"blockDriveBaseConfigure","id":"Jhoo{a.n+;--ou^IiKH~","extraState":{"optionLevel":1},"fields":{"METHOD":"DRIVEBASE_STRAIGHT_SPEED"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"q1kLD2u9KK^3mptR~(z1","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_speed","id":";;auP?N:0/$WwzMN#5-F","fields":{"VALUE0":700}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"B^Ue9b-N,]`?1`iYX7ZS","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"4?L?HI3B2q09P%of3zC[","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"[=xY3v3$HgC$DF*{?0qu","fields":{"VALUE0":180}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"#^:R2G44s=g)q5QlcjdR","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"5.6W+yuE_L+I,kUa4;5d","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"KekpumMAv%@^;rj}!MK}","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"5Qr_{%|4t;|1d#((70FM","fields":{"VALUE0":-85}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"7~b{LT9(Vn_[/TLr-SGo","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"j0_I`lPq$-@IPpak3JE2","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"c2HHA3BWN4dByse}~n`@","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"D;nD;u*v*[iBLQ9{znlH","fields":{"VALUE0":185}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"C@Bw3}Kb%EfDOrofdyC4","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"KZDp9a.6-pO:Wr$w=pwa","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":",oM_[7w$xV-Gp2`6sFW@","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"zB_|+LZ2yrpY2=L2M2?1","fields":{"VALUE0":85}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"j_Dz;ekU@+(e`|-/VJ3t","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"s5JpD73rHF!_O-PTV]Cn","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"k!wxfZznL$nV)A@iYhql","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"FE9TZJht;/ki[F~W(~cd","fields":{"VALUE0":450}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"gA#Bl2pKVTBU=N:GY,)!","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"gvj!EMK}F|CY:)Gc^=S~","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"8HX:szO8nrm/NNFF5MNP","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"Di_lC`oCsU1,KX)q|!#-","fields":{"VALUE0":40}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"-){d3hzxT8VHK*[B!bL{","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"@~Y50t:XzK1j1/u}kofV","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"~1D~qt`8fbgQ#[Im=xR8","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"9DdeTOqNvUo#waFcyYck","fields":{"VALUE0":80}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"VK+XS6JbW81m3=.bx6zs","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"q(RN8L$(.2Iu|b^~}OWD","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"9$=0hHCQzI:lc5@f186A","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"gWT6x4;^SE(J*oh!4LvZ","fields":{"VALUE0":-60}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"u=PP#fUmQCUD71y_E]8)","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"U{zne|5c+?oS1O$Zd#/o","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"cZ,w(F~)e_!VI|./e]%N","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"Ra%C(#5AxvBu=}F~UO}#","fields":{"VALUE0":-85}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"WNjNM3VO8]@%dQ.h)+I/","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"W{W,RS{,8M.E|KdM2!Yc","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"S|c5~7Y12ClO;GTyqtUv","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"S.)i-($uT_gD{@/udfoN","fields":{"VALUE0":100}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"HaxeMmFN}R/M:`.Rk0`{","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"Natcveuo9Zs8a8iLCAE=","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"K3TW/5l^b_|q,0-iP4b6","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"1gj(g:UV4B3.il,la1CF","fields":{"VALUE0":-180}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"{1k_tM$1zg(`$T2:l~F7","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"lTPxhKZAP:Bs*iKG|B*8","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"$%4=*[0#W9#y?V=7YTX9","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"TpJy#/F~Ix59u-))V%S,","fields":{"VALUE0":20}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"kD%Ek`4mqzqGR6sL|G}/","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"E%3Smng**55u.~672*9p","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"HBYy4xRx7XCp~8-n!TeU","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"E`2EZE=|$:%RY}B}pwzE","fields":{"VALUE0":-200}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"ZCT8jwwqJl!xYu*h|Oee","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"wc|VE:|%zre(PEX;gPo1","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"!y.nAx}gze)D!MAh#%VW","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"xILWsb^QPo6HPEyv23FA","fields":{"VALUE0":250}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"5(F^R|=+1e8XWh$YNkIP","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"Wo/Tmq#eS4gAF%KQT#wV","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"vbG)RKZFkQ`fQ@b+=l{J","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"WX5OVveM1sza^OTjCP:F","fields":{"VALUE0":-90}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"7[C}c-OE6}v_%awH.mL@","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"k8I8pI.|W)26ni#Ohqo#","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"uRf@ner{/Op?.~c%AU[Y","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"YZ_=7.k5h*T%d@gQ7s|,","fields":{"VALUE0":500}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":".-IhCy-HIy(b|Ra2Objb","fields":{"VALUE":"Stop.HOLD"}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}},{"type":"blockComment","id":"(?mHSXTT$E#?n*8wD$Q@","x":746,"y":1974,"enabled":false,"fields":{"FIELDNAME":"Mission 9_push the rd lever"}}]},"variables":[{"name":"red","id":"h$0V_Yt(t=Z^Js(/1{)%","type":"ColorDef"},{"name":"orange","id":"Xg:/5}AsI[+m17s6,v21","type":"ColorDef"},{"name":"yellow","id":"oK[2ogh@tBz;{#/Ha_d9","type":"ColorDef"},{"name":"green","id":"yDXVB7[1d,EwqspHqcRy","type":"ColorDef"},{"name":"cyan","id":"[Sqwy^o}3JlB#lf.C8K^","type":"ColorDef"},{"name":"blue","id":"%,Cxlm]us!PBq=L5sN58","type":"ColorDef"},{"name":"violet","id":"D1c;vx%^__7^E@2`Xe3_","type":"ColorDef"},{"name":"magenta","id":"tC]CPmaB)jb|Q/=D/TMe","type":"ColorDef"},{"name":"white","id":"3Us_]nt]o2gt*8t(}@Sw","type":"ColorDef"},{"name":"none","id":";VdF3wIsmw8D^^[|(@C(","type":"ColorDef"},{"name":"prime hub","id":"sNUcHq,4GbT0i33*%t,)","type":"PrimeHub"},{"name":"drive base","id":"~0u;A(JuO[Z-g!T!n@??","type":"DriveBase"},{"name":"right","id":"`#(M;o4ZYJq8tDB[iZ?C","type":"Motor"},{"name":"left","id":"Lb2},;H,NK3nY.@}-|9Z","type":"Motor"},{"name":"left gear","id":"1BViSmy2Le21h-xrhOd3","type":"Motor"},{"name":"Mission 6 - Forge","id":"q^N#pJB!0_J@T5th@}q7","type":"Function"}],"info":{"type":"pybricks","version":"1.3.2"}}
-from pybricks.hubs import PrimeHub
-from pybricks.parameters import Direction, Port
-from pybricks.pupdevices import Motor
-from pybricks.robotics import DriveBase
+from engine import SETTINGS, STRAIGHT, TURN, run
+from runtime import launch
+
+
+MISSION_6___FORGE = (
+    (SETTINGS, 700),
+    (STRAIGHT, 180),
+    (TURN, -85),
+    (STRAIGHT, 185),
+    (TURN, 85),
+    (STRAIGHT, 450),
+    (TURN, 40),
+    (STRAIGHT, 80),
+    (TURN, -60),
+    (TURN, -85),
+    (STRAIGHT, 100),
+    (STRAIGHT, -180),
+    (TURN, 20),
+    (STRAIGHT, -200),
+    (STRAIGHT, 250),
+    (TURN, -90),
+    (STRAIGHT, 500),
+)
 
-# Set up all devices.
-prime_hub = PrimeHub()
-right = Motor(Port.C, Direction.CLOCKWISE)
-left = Motor(Port.A, Direction.COUNTERCLOCKWISE)
-left_gear = Motor(Port.B, Direction.CLOCKWISE)
-drive_base = DriveBase(left, right, 56, 80)
 
 def Mission_6___Forge():
-    drive_base.settings(straight_speed=700)
-    drive_base.straight(180)
-    drive_base.turn(-85)
-    drive_base.straight(185)
-    drive_base.turn(85)
-    drive_base.straight(450)
-    drive_base.turn(40)
-    drive_base.straight(80)
-    drive_base.turn(-60)
-    drive_base.turn(-85)
-    drive_base.straight(100)
-    drive_base.straight(-180)
-    drive_base.turn(20)
-    drive_base.straight(-200)
-    drive_base.straight(250)
-    drive_base.turn(-90)
-    drive_base.straight(500)
+    run(MISSION_6___FORGE)
 
 
 # The main program starts here.
-drive_base.use_gyro(True)
-drive_base.reset(0, 0)
-left.reset_angle(0)
-Mission_6___Forge()
+if __name__ == "__main__":
+    launch(Mission_6___Forge)
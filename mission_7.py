@@ -1,46 +1,45 @@
-# pybricks blocks file:{"blocks":{"languageVersion":0,"blocks":[{"type":"blockGlobalSetup","id":"bjK,wS1MYO7aiYkFSwd{","x":63,"y":-19,"deletable":false,"next":{"block":{"type":"variables_set_prime_hub","id":"TOr[Y*p6lW/mk5ydzJ#@","extraState":{"optionLevel":0},"fields":{"VAR":{"id":"sNUcHq,4GbT0i33*%t,)"}},"next":{"block":{"type":"variables_set_motor","id":"J!fB%D37_bqds/yFx|Fk","fields":{"VAR":{"id":"`#(M;o4ZYJq8tDB[iZ?C"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"E:Toyf{|mW=_v|M,+o#=","fields":{"NAME":"C"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"mD8,(?-*+k8i0TKR]l,I","fields":{"SELECTION":"Direction.CLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"c!**t.gxCHJ4LNA!#hV{","fields":{"VAR":{"id":"Lb2},;H,NK3nY.@}-|9Z"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"oq$BVRUy8pUk+ulh#f7t","fields":{"NAME":"A"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"-(#8@OYHXhZt3^%G%PpB","fields":{"SELECTION":"Direction.COUNTERCLOCKWISE"}}}},"next":{"block":{"type":"variables_set_motor","id":"I;4yUi/,t,,__sRwxa-y","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3"}},"inputs":{"PORT":{"shadow":{"type":"blockParametersPort","id":"D0(|}9QKM$)zV@z|qc6U","fields":{"NAME":"B"}}},"POSITIVE_DIRECTION":{"shadow":{"type":"blockParametersDirection","id":"4~-/nZ)^|$H6@g7oUJNA","fields":{"SELECTION":"Direction.CLOCKWISE"}}}},"next":{"block":{"type":"variables_set_drive_base","id":"(x=A|9k8X4?x9gd`kQFd","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??"}},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"+Z3N6A:Gsmr:4{_=e~.A","fields":{"VAR":{"id":"Lb2},;H,NK3nY.@}-|9Z","name":"left","type":"Motor"}}}},"VAR2":{"shadow":{"type":"variables_get_motor_device","id":"_`b.pWp2?1y,=*gjul:v","fields":{"VAR":{"id":"`#(M;o4ZYJq8tDB[iZ?C","name":"right","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_distance","id":"jvAHBV:=ex69.!zu)Qk#","fields":{"VALUE0":56}}},"VALUE1":{"shadow":{"type":"unit_distance","id":"U]{pA$:ON}LxCi8cKzrc","fields":{"VALUE0":80}}}}}}}}}}}}}}},{"type":"blockGlobalStart","id":"3tJe|AWl0baN(wH9a$@.","x":-244,"y":277,"deletable":false,"next":{"block":{"type":"blockDriveBaseUseGyro","id":"(:DT/*A7MqXWi;p9Y~~E","fields":{"METHOD":"DRIVEBASE_USE_GYRO_TRUE"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"0hc#EhoI8T}JNPV9P?^1","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}}},"next":{"block":{"type":"blockDriveBaseResetWithValues","id":"uy{47KXe?jUIt[+H?^Yx","inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"CmZEWY,qv)5~=qh@pJc8","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"VALUE0":{"shadow":{"type":"unit_distance","id":"){g;?4c#g8_O]n5Lf]LZ","fields":{"VALUE0":0}}},"VALUE1":{"shadow":{"type":"unit_angle","id":"YQI[!)JwMTj;`)S1%;Iy","fields":{"VALUE0":0}}}},"next":{"block":{"type":"blockMotorResetAngle","id":"IFlqJrKL^9z/PrhNx6j]","inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"aj)8,e#y@fK,EJt%H*^2","fields":{"VAR":{"id":"Lb2},;H,NK3nY.@}-|9Z","name":"left","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angle","id":"|conOpE5*x?,Pm;8Sic2","fields":{"VALUE0":0}}}},"next":{"block":{"type":"blockFunctionCallerStatement","id":"CDC=G@E~#~srzw4k1|},","extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"q^N#pJB!0_J@T5th@}q7"}}}}}}}}}}},{"type":"variables_setup_function","id":"gkVR}ZA=W]F/wK5hR6ZW","x":163,"y":474,"extraState":{"optionLevel":0},"fields":{"ICON":"TASK","VAR":{"id":"q^N#pJB!0_J@T5th@}q7"}},"inputs":{"STACK":{"block":{"type":"blockDriveBaseConfigure","id":"Jhoo{a.n+;--ou^IiKH~","extraState":{"optionLevel":1},"fields":{"METHOD":"DRIVEBASE_STRAIGHT_SPEED"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"q1kLD2u9KK^3mptR~(z1","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_speed","id":";;auP?N:0/$WwzMN#5-F","fields":{"VALUE0":700}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"B^Ue9b-N,]`?1`iYX7ZS","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"4?L?HI3B2q09P%of3zC[","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"[=xY3v3$HgC$DF*{?0qu","fields":{"VALUE0":180}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"#^:R2G44s=g)q5QlcjdR","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"5.6W+yuE_L+I,kUa4;5d","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"KekpumMAv%@^;rj}!MK}","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"5Qr_{%|4t;|1d#((70FM","fields":{"VALUE0":-85}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"7~b{LT9(Vn_[/TLr-SGo","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"j0_I`lPq$-@IPpak3JE2","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"c2HHA3BWN4dByse}~n`@","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"D;nD;u*v*[iBLQ9{znlH","fields":{"VALUE0":185}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"C@Bw3}Kb%EfDOrofdyC4","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"KZDp9a.6-pO:Wr$w=pwa","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":",oM_[7w$xV-Gp2`6sFW@","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"zB_|+LZ2yrpY2=L2M2?1","fields":{"VALUE0":85}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"j_Dz;ekU@+(e`|-/VJ3t","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"s5JpD73rHF!_O-PTV]Cn","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"k!wxfZznL$nV)A@iYhql","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"FE9TZJht;/ki[F~W(~cd","fields":{"VALUE0":420}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"gA#Bl2pKVTBU=N:GY,)!","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"gvj!EMK}F|CY:)Gc^=S~","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"8HX:szO8nrm/NNFF5MNP","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"Di_lC`oCsU1,KX)q|!#-","fields":{"VALUE0":60}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"-){d3hzxT8VHK*[B!bL{","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"X^nK{PQWzpYz+hJ`O-Z`","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"_%?4t0ti[h!mqeAuD4^v","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"kGz-D%o7{a]WMi5^X@o*","fields":{"VALUE0":185}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"Bd-[~}j4?OZT,NtOsEtM","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"UEv4(12r!]$92OZr.{r3","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"doQ2MJRpEU9iBJ~=Yp*2","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"=fl{ut+[i8pfh,r=_X}#","fields":{"VALUE0":200}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"e8htUoSLs+L9[8mV4,^0","fields":{"VALUE0":450}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"Xh;6)~Vt/D,3!JqU+`}e","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"=@:B=s[^@U]RG*U[!Im*","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"xg1c=y+Joco`]7gIqtrj","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"/!vlT!_X]a9mdAGj.zt,","fields":{"VALUE0":200}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"Dn4yDs^8YC-]#zE~+1^T","fields":{"VALUE0":-75}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"=9A(0H8qaLM(uYBO9rx9","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockWaitTime","id":"Alj:,)``d%)7}_r%[;L-","inputs":{"VALUE0":{"shadow":{"type":"unit_time","id":"9?08%x)Cc=4b]*v##lpd","fields":{"VALUE0":2000}}}},"next":{"block":{"type":"blockDriveBaseConfigure","id":"jVjM8W{mxKlnYsZ]nD,{","extraState":{"optionLevel":1},"fields":{"METHOD":"DRIVEBASE_STRAIGHT_SPEED"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"2dQk,4vK2xpO/GIJM)]K","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_speed","id":"Zs:|U1@Gc%2oyKb4wc@+","fields":{"VALUE0":200}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"pM=:#]=n;Z3yy}GaLUPA","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"(z?vI8#GLYk2b0t}(2`B","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"1coec/?2M*SrD}RR^6sw","fields":{"VALUE0":-36}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"(j1SW}juLRgAgwhAyLa1","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockWaitTime","id":"zq).a9j?Ev=GIP391pCx","inputs":{"VALUE0":{"shadow":{"type":"unit_time","id":"Omk+y|tQ6@Qa^,k^d^|0","fields":{"VALUE0":2000}}}},"next":{"block":{"type":"blockMotorRun","id":"e58*~I}/B!3hMTd?+K;G","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"Lbf,,phxcNgScxIfAYdb","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":";phO^1XT2*JaONFFEt4h","fields":{"VALUE0":200}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"y^.Y%Rg|hWZ[aSZz%hv/","fields":{"VALUE0":-25}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"O5}Ms.94ypLY@4nO|pm0","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseConfigure","id":"XdMJUdh[I1C0G]NC}ir:","extraState":{"optionLevel":1},"fields":{"METHOD":"DRIVEBASE_STRAIGHT_SPEED"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"xmhsIT|=gW!SpNt=LB^;","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_speed","id":"g33vyP_XYVQ,UIeEoeJk","fields":{"VALUE0":200}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"(.jyeWS0$4P$OEU,ZU5]","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"??G}d]UdznuFM|MfBs?A","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":":L}N_^s-4%,oyu|JRe[}","fields":{"VALUE0":-50}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"*Q%1?D1fO5F%~!,z2S9+","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"KN?GkXh[m8mT4)[__!vV","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"E=*35u,]D6Su)*ckAEcR","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"Ij^?GC;M]#_A|FMJx}x.","fields":{"VALUE0":100}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"4)VVZFSAPBT7gNNtiv)a","fields":{"VALUE0":-150}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"4l;6|Nsb5%LADvC~.gt:","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"vm535?a0?AsYcj$.Ju@{","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"B_NJhLC?Uy1CTw`X!2}e","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"B0ZNMh)STD,#xP;m1cl/","fields":{"VALUE0":56}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"QuDwf,zf|ZP[b30}*L-*","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"{^BZ!cVu~0,y1gb1KUmW","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"Go8o4$ep~V-je2+nm(I@","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"Z8h9zc|,-EE+{a{le3aR","fields":{"VALUE0":-120}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"pSo1$El/:?GA*7A/J9=E","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"ouYiJ=qvF1M-ZdP`^6(3","extraState":{"optionLevel":4},"fields":{"METHOD":"DRIVEBASE_DRIVE_ARC_ANGLE"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"#sOVgy)1AHkj_RM1hb?-","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"zbPVeu]-O=0tp.+mJGJx","fields":{"VALUE0":140}}},"ARG1":{"shadow":{"type":"unit_angle","id":"I.(thcqCcR=4S?cfyH+c","fields":{"VALUE0":-170}}},"ARG2":{"shadow":{"type":"parameters_stop_4","id":"-Ar4BzhYLorm@3,%`os?","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":",hW(Y#F%^k5CM~k4ZkW=","extraState":{"optionLevel":2},"fields":{"METHOD":"DRIVEBASE_DRIVE_STRAIGHT"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"FBZiJ.m(3U[~U@1czZW+","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_distance","id":"wbQ1N-lD#T:6/9QCHdlC","fields":{"VALUE0":-200}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"Et+ZiW_X;B5#KQji%QRh","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockDriveBaseDrive2","id":"2*5pjW},WqK/y1$-!*9#","extraState":{"optionLevel":3},"fields":{"METHOD":"DRIVEBASE_DRIVE_TURN"},"inputs":{"VAR":{"shadow":{"type":"variables_get_drive_base_device","id":"V0!HEPL~ejc(8D5KyWi=","fields":{"VAR":{"id":"~0u;A(JuO[Z-g!T!n@??","name":"drive base","type":"DriveBase"}}}},"ARG0":{"shadow":{"type":"unit_angle","id":"[-$[mz@.-P{gb%,F,sHD","fields":{"VALUE0":-90}}},"ARG1":{"shadow":{"type":"parameters_stop_4","id":"3YxjI6bDSj_%TXD_.H{i","fields":{"VALUE":"Stop.HOLD"}}}},"next":{"block":{"type":"blockMotorRun","id":"OL9}@zkDyV%Q5hC@6SLl","extraState":{"optionLevel":1},"fields":{"METHOD":"MOTOR_RUN_FOR"},"inputs":{"VAR":{"shadow":{"type":"variables_get_motor_device","id":"$r{Kegr[DaI,qo|7T*=w","fields":{"VAR":{"id":"1BViSmy2Le21h-xrhOd3","name":"left gear","type":"Motor"}}}},"VALUE0":{"shadow":{"type":"unit_angularVelocity","id":"?ue-`k]V;-NaB(U-A18B","fields":{"VALUE0":200}}},"ANGLE":{"shadow":{"type":"unit_angle","id":"LpoSG9W,xE|5=rH(+aim","fields":{"VALUE0":300}}},"THEN":{"shadow":{"type":"parameters_stop_4","id":"vz=q3_QXvHU%$BbtP6:.","fields":{"VALUE":"Stop.HOLD"}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}]},"variables":[{"name":"red","id":"h$0V_Yt(t=Z^Js(/1{)%","type":"ColorDef"},{"name":"orange","id":"Xg:/5}AsI[+m17s6,v21","type":"ColorDef"},{"name":"yellow","id":"oK[2ogh@tBz;{#/Ha_d9","type":"ColorDef"},{"name":"green","id":"yDXVB7[1d,EwqspHqcRy","type":"ColorDef"},{"name":"cyan","id":"[Sqwy^o}3JlB#lf.C8K^","type":"ColorDef"},{"name":"blue","id":"%,Cxlm]us!PBq=L5sN58","type":"ColorDef"},{"name":"violet","id":"D1c;vx%^__7^E@2`Xe3_","type":"ColorDef"},{"name":"magenta","id":"tC]CPmaB)jb|Q/=D/TMe","type":"ColorDef"},{"name":"white","id":"3Us_]nt]o2gt*8t(}@Sw","type":"ColorDef"},{"name":"none","id":";VdF3wIsmw8D^^[|(@C(","type":"ColorDef"},{"name":"prime hub","id":"sNUcHq,4GbT0i33*%t,)","type":"PrimeHub"},{"name":"drive base","id":"~0u;A(JuO[Z-g!T!n@??","type":"DriveBase"},{"name":"right","id":"`#(M;o4ZYJq8tDB[iZ?C","type":"Motor"},{"name":"left","id":"Lb2},;H,NK3nY.@}-|9Z","type":"Motor"},{"name":"left gear","id":"1BViSmy2Le21h-xrhOd3","type":"Motor"},{"name":"mission 7","id":"q^N#pJB!0_J@T5th@}q7","type":"Function"}],"info":{"type":"pybricks","version":"1.3.2"}}
-from pybricks.hubs import PrimeHub
-from pybricks.parameters import Direction, Port, Stop
-from pybricks.pupdevices import Motor
-from pybricks.robotics import DriveBase
-from pybricks.tools import wait
+from engine import (ARC, LEFT_GEAR, RUN_ANGLE, SETTINGS, START, STRAIGHT,
+                    TURN, UNTIL_DONE, WAIT, run)
+from runtime import launch
+
+
+MISSION_7 = (
+    (SETTINGS, 700),
+    (STRAIGHT, 180),
+    (TURN, -85),
+    (STRAIGHT, 185),
+    (TURN, 85),
+    (STRAIGHT, 420),
+    (TURN, 60),
+    (STRAIGHT, 185),
+    (RUN_ANGLE, LEFT_GEAR, 200, 450),
+    # Watch the arm while it works the model: the wait ends once it is on
+    # target, or stalled against the model, and still. The timeout covers
+    # the move and the 2 s pause that used to follow it.
+    (START, LEFT_GEAR, 200, -75),
+    (UNTIL_DONE, LEFT_GEAR, 2500, "mission 7 arm"),
+    (SETTINGS, 200),
+    (TURN, -36),
+    # Nothing the robot senses shows the model reacting to the turn, so
+    # this stays a fixed pause.
+    (WAIT, 2000),
+    (RUN_ANGLE, LEFT_GEAR, 200, -25),
+    (SETTINGS, 200),
+    (STRAIGHT, -50),
+    (RUN_ANGLE, LEFT_GEAR, 100, -150),
+    (TURN, 56),
+    (STRAIGHT, -120),
+    (ARC, 140, -170),
+    (STRAIGHT, -200),
+    (TURN, -90),
+    (RUN_ANGLE, LEFT_GEAR, 200, 300),
+)
 
-# Set up all devices.
-prime_hub = PrimeHub()
-right = Motor(Port.C, Direction.CLOCKWISE)
-left = Motor(Port.A, Direction.COUNTERCLOCKWISE)
-left_gear = Motor(Port.B, Direction.CLOCKWISE)
-drive_base = DriveBase(left, right, 56, 80)
 
 def mission_7():
-    drive_base.settings(straight_speed=700)
-    drive_base.straight(180)
-    drive_base.turn(-85)
-    drive_base.straight(185)
-    drive_base.turn(85)
-    drive_base.straight(420)
-    drive_base.turn(60)
-    drive_base.straight(185)
-    left_gear.run_angle(200, 450)
-    left_gear.run_angle(200, -75)
-    wait(2000)
-    drive_base.settings(straight_speed=200)
-    drive_base.turn(-36)
-    wait(2000)
-    left_gear.run_angle(200, -25)
-    drive_base.settings(straight_speed=200)
-    drive_base.straight(-50)
-    left_gear.run_angle(100, -150)
-    drive_base.turn(56)
-    drive_base.straight(-120)
-    drive_base.arc(140, angle=-170)
-    drive_base.straight(-200)
-    drive_base.turn(-90)
-    left_gear.run_angle(200, 300)
+    run(MISSION_7)
 
 
 # The main program starts here.
-drive_base.use_gyro(True)
-drive_base.reset(0, 0)
-left.reset_angle(0)
-mission_7()
+if __name__ == "__main__":
+    launch(mission_7)
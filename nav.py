@@ -0,0 +1,119 @@
+from math import atan2, cos, pi, sin, sqrt
+
+from pybricks.tools import wait
+
+# A waypoint closer than this, in mm, counts as reached.
+TOLERANCE = 5
+# Speed and distance for backing into a wall to square up against it.
+ALIGN_SPEED = 100
+ALIGN_DISTANCE = -150
+
+
+def wrap(angle):
+    # The same heading as angle, between -180 and 180 degrees.
+    return (angle + 180) % 360 - 180
+
+
+class Navigator:
+    # Keeps track of where the robot is on the field, from the distance and
+    # gyro heading of drive_base.state(), and drives to field positions.
+    # Positions are in mm, x forward and y to the right of where the robot
+    # was launched, and headings are clockwise as for turn(). Every
+    # waypoint is aimed at from where the robot really is, so errors of
+    # earlier moves are corrected instead of adding up.
+
+    def __init__(self, drive_base):
+        self.drive_base = drive_base
+        self.x = 0.0
+        self.y = 0.0
+        self.distance = 0
+        self.angle = 0.0
+        # True while the navigator moves the robot, so the moves are not
+        # taken as tuned segments, see tuning.py.
+        self.driving = False
+
+    def reset(self, x=0, y=0, heading=0):
+        # Set the position of the robot, and its heading on the gyro.
+        self.drive_base.reset(0, heading)
+        self.x = x
+        self.y = y
+        self.distance = 0
+        self.angle = heading
+
+    def update(self):
+        # Add the move since the last update. Moves are straight, turns or
+        # arcs, so the robot went along the chord at the mean heading.
+        distance, _, angle, _ = self.drive_base.state()
+        moved = distance - self.distance
+        half = (angle - self.angle) * pi / 360
+        if abs(half) > 0.01:
+            moved *= sin(half) / half
+        heading = (angle + self.angle) * pi / 360
+        self.x += moved * cos(heading)
+        self.y += moved * sin(heading)
+        self.distance = distance
+        self.angle = angle
+
+    def pose(self):
+        self.update()
+        return self.x, self.y, self.angle
+
+    def go_to(self, x, y, heading=None, speed=None, backwards=False):
+        # Turn towards (x, y), drive there and turn to heading, if given.
+        # A speed sets the straight speed for this move only.
+        self.update()
+        dx = x - self.x
+        dy = y - self.y
+        distance = sqrt(dx * dx + dy * dy)
+        if distance > TOLERANCE:
+            bearing = atan2(dy, dx) * 180 / pi
+            if backwards:
+                bearing += 180
+                distance = -distance
+            settings = self.drive_base.settings()
+            if speed is not None:
+                self.drive_base.settings(straight_speed=speed)
+            self.driving = True
+            self.drive_base.turn(wrap(bearing - self.angle))
+            self.drive_base.straight(distance)
+            # Drive what is still missing along the new heading.
+            self.update()
+            h = self.angle * pi / 180
+            along = (x - self.x) * cos(h) + (y - self.y) * sin(h)
+            if abs(along) > TOLERANCE:
+                self.drive_base.straight(along)
+            self.driving = False
+            if speed is not None:
+                self.drive_base.settings(*settings)
+        if heading is not None:
+            self.turn_to(heading)
+
+    def turn_to(self, heading):
+        # Turn to a heading on the gyro, whatever turns came before.
+        self.update()
+        turn = wrap(heading - self.angle)
+        if abs(turn) >= 1:
+            self.driving = True
+            self.drive_base.turn(turn)
+            self.driving = False
+
+    def align(self, heading, x=None, y=None, distance=ALIGN_DISTANCE):
+        # Back slowly into a wall or other straight edge until the robot
+        # stalls against it. The robot then faces heading, and its x or y
+        # is known, if given.
+        settings = self.drive_base.settings()
+        self.drive_base.settings(straight_speed=ALIGN_SPEED)
+        self.driving = True
+        self.drive_base.straight(distance, wait=False)
+        self.driving = False
+        while not self.drive_base.done() and not self.drive_base.stalled():
+            wait(10)
+        self.drive_base.stop()
+        self.drive_base.settings(*settings)
+        self.update()
+        self.drive_base.reset(self.distance, heading)
+        self.angle = heading
+        if x is not None:
+            self.x = x
+        if y is not None:
+            self.y = y
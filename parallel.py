@@ -0,0 +1,28 @@
+from pybricks.parameters import Stop
+
+from runtime import poll
+
+# Attachment motors that are still moving in the background.
+pending = []
+
+
+def start(motor, speed, angle, then=Stop.HOLD):
+    # Start an attachment move and return at once, so the next drive
+    # commands run while the attachment is still moving. Use this only for
+    # moves that nothing else depends on, like stowing an arm after use.
+    finish(motor)
+    motor.run_angle(speed, angle, then, wait=False)
+    pending.append(motor)
+
+
+def finish(*devices):
+    # Wait for background moves to complete. Without arguments this waits
+    # for all of them. Also works for a drive base started with wait=False.
+    # Call this before a move that needs the attachment in place, before
+    # using a motor directly again, and at the end of a program, because
+    # motors stop when the program ends.
+    for device in devices or list(pending):
+        while not device.done():
+            poll(5)
+        if device in pending:
+            pending.remove(device)
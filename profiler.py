@@ -0,0 +1,18 @@
+from pybricks.tools import hub_menu
+
+import engine
+from programs import programs
+from runtime import launch
+
+# Choose a program from the menu and run it with every step timed. The
+# times are printed when the program ends or is stopped; save the console
+# output and compare it with host/bench.py --hub.
+selected = hub_menu(*programs)
+mission = programs[selected]
+profile = engine.Profile()
+engine.profile = profile
+try:
+    launch(mission)
+finally:
+    engine.profile = None
+    profile.report(mission.__name__)
@@ -0,0 +1,20 @@
+from Mission1_2 import mission_1_2
+from Mission1_3_13 import mission_1_3_13
+from Mission_12 import mission_12
+from Missions_8_5_9_and_10 import missions_8_5_9_and_10
+from mission_10_pull import mission_10_pull
+from mission_6 import Mission_6___Forge
+from mission_7 import mission_7
+from mission_9_pull import Missioon_9__Pull
+
+# The programs, in the order of the menu.
+programs = {
+    "A": missions_8_5_9_and_10,
+    "B": Missioon_9__Pull,
+    "C": mission_10_pull,
+    "D": Mission_6___Forge,
+    "E": mission_7,
+    "F": mission_1_2,
+    "G": mission_1_3_13,
+    "H": mission_12,
+}
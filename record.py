@@ -0,0 +1,22 @@
+from pybricks.tools import hub_menu
+
+import runtime
+from telemetry import Recorder
+
+recorder = Recorder(runtime.prime_hub)
+runtime.record(recorder)
+
+# The missions are imported after the devices are wrapped for recording.
+from programs import programs  # noqa: E402
+
+# Choose a program from the menu and run it while recording. The recording
+# is printed when the program ends or is stopped; save the console output
+# and read it with host/analyze.py. Run the same program several times to
+# see how much the runs differ.
+selected = hub_menu(*programs)
+mission = programs[selected]
+recorder.begin(mission.__name__)
+try:
+    runtime.launch(mission)
+finally:
+    recorder.dump()
@@ -0,0 +1,72 @@
+from pybricks.hubs import PrimeHub
+from pybricks.parameters import Direction, Port
+from pybricks.pupdevices import Motor
+from pybricks.robotics import DriveBase
+from pybricks.tools import wait
+
+from calibration import Compensator, geometry
+from nav import Navigator
+from tuning import TunedDriveBase
+
+# Set up all devices once. The menu and every mission share them, so
+# starting a program does not set up the hub and motors again.
+prime_hub = PrimeHub()
+right = Motor(Port.C, Direction.CLOCKWISE)
+left = Motor(Port.A, Direction.COUNTERCLOCKWISE)
+left_gear = Motor(Port.B, Direction.CLOCKWISE)
+# The wheel diameter and axle track measured by calibrate.py.
+wheel_diameter, axle_track = geometry(prime_hub)
+drive_base = TunedDriveBase(DriveBase(left, right, wheel_diameter, axle_track))
+drive_base.use_gyro(True)
+drive_base.compensator = Compensator(
+    prime_hub, (left, right), wheel_diameter, axle_track)
+navigator = Navigator(drive_base)
+drive_base.navigator = navigator
+
+# Missions change these, so each launch starts again from the defaults.
+drive_settings = drive_base.settings()
+left_gear_limits = left_gear.control.limits()
+
+_right_gear = None
+_recorder = None
+
+
+def right_gear():
+    # Only Mission1_3_13 has an attachment on port D, so that motor is set
+    # up the first time a mission asks for it.
+    global _right_gear
+    if _right_gear is None:
+        _right_gear = Motor(Port.D, Direction.COUNTERCLOCKWISE)
+        if _recorder is not None:
+            _right_gear = _recorder.add(_right_gear, "right_gear")
+    return _right_gear
+
+
+def record(recorder):
+    # Sample the drive base and attachment motors while they move, see
+    # telemetry.py. Call this before the missions are imported, because they
+    # keep the devices they import.
+    global drive_base, left_gear, _recorder
+    _recorder = recorder
+    drive_base = recorder.add(drive_base, "drive_base")
+    navigator.drive_base = drive_base
+    left_gear = recorder.add(left_gear, "left_gear")
+
+
+def poll(time):
+    # Pause a polling loop for time ms. Loops that wait for something to
+    # happen use this instead of wait(), so the recording goes on while
+    # they wait.
+    if _recorder is not None:
+        _recorder.tick()
+    wait(time)
+
+
+def launch(mission):
+    # Run a mission from base, with its tuned segment settings.
+    drive_base.settings(*drive_settings)
+    left_gear.control.limits(*left_gear_limits)
+    navigator.reset()
+    left.reset_angle(0)
+    drive_base.begin(mission.__name__)
+    mission()
@@ -0,0 +1,46 @@
+from runtime import poll
+
+# A stroke is sent back once the motor is this close to its end, in
+# degrees, instead of waiting for the motor to stop and settle there. The
+# motor is braking by then anyway, so it still turns at about the end.
+MARGIN = 10
+POLL = 2
+
+
+def oscillate(motor, speed, angle, times, acceleration=None, label="motor"):
+    # Move the motor by angle and back again, times times over, as one
+    # continuous motion. The acceleration, if given, is set once and stays
+    # set, like control.limits(). A stroke that stalls counts as ended. The
+    # last stroke ends on the start angle with the motor holding there.
+    # Prints and returns the round trips made, the smallest amplitude
+    # reached in degrees and the number of stalls.
+    if acceleration is not None:
+        motor.control.limits(acceleration=acceleration)
+    sign = 1 if (speed < 0) == (angle < 0) else -1
+    home = motor.angle()
+    ends = (home + sign * abs(angle), home)
+    strokes = stalls = reached = 0
+    amplitude = None
+    last = 2 * times - 1
+    for stroke in range(2 * times):
+        target = ends[stroke % 2]
+        motor.run_target(speed, target, wait=False)
+        if stroke % 2 == 0:
+            reached = 0
+        while True:
+            position = motor.angle()
+            reached = max(reached, (position - home) * sign)
+            if motor.stalled():
+                stalls += 1
+                break
+            if motor.done() or (
+                    stroke < last and abs(target - position) <= MARGIN):
+                break
+            poll(POLL)
+        if stroke % 2:
+            strokes += 1
+            amplitude = reached if amplitude is None else min(
+                amplitude, reached)
+    print("oscillate", label, strokes, "of", times, "round trips, amplitude",
+          amplitude, "deg,", stalls, "stalls")
+    return strokes, amplitude, stalls
@@ -0,0 +1,173 @@
+from array import array
+
+from pybricks.tools import StopWatch, wait
+
+# Time between samples in ms, and how often a running move is checked for
+# completion between samples.
+PERIOD = 25
+POLL = 5
+# Samples kept. Once full, the oldest samples are overwritten, so the end
+# of a long run is always there. Step start and end times are kept for the
+# whole run in a table of their own.
+SIZE = 600
+MAX_STEPS = 200
+# Attachment motors that can be watched besides the drive base.
+MAX_MOTORS = 2
+# Columns of a sample: the drive base state, the gyro heading and the
+# battery voltage, then angle, speed and load of each attachment motor.
+# Angles and headings are kept in tenths of a degree.
+DRIVE_FIELDS = ("time", "step", "distance", "speed", "angle10", "turn_rate",
+                "heading10", "battery")
+MOTOR_FIELDS = ("angle", "speed", "load")
+FIELDS = len(DRIVE_FIELDS) + MAX_MOTORS * len(MOTOR_FIELDS)
+
+# Moves that take wait=True and are sampled until they are done.
+MOVES = ("straight", "turn", "arc", "run_angle", "run_target", "run_time")
+
+
+class Recorder:
+    # Ring buffer of samples taken while watched devices move. Everything
+    # is allocated up front so sampling does not grow the heap during a
+    # run. Dump the buffer to the console with dump() after the run.
+
+    def __init__(self, hub, size=SIZE, period=PERIOD):
+        self.hub = hub
+        self.size = size
+        self.period = period
+        self.samples = array("i", [0] * (size * FIELDS))
+        self.starts = array("i", [0] * MAX_STEPS)
+        self.ends = array("i", [0] * MAX_STEPS)
+        self.labels = []
+        self.drive = None
+        self.motors = []
+        self.names = []
+        self.watch = StopWatch()
+        self.mission = None
+        self.begin("?")
+
+    def begin(self, mission):
+        # Start a new recording for a mission.
+        self.mission = mission
+        self.count = 0
+        self.steps = 0
+        self.step = -1
+        self.labels.clear()
+        self.watch.reset()
+        self.due = 0
+
+    def add(self, device, name):
+        # Watch a device and return it wrapped, see Recorded.
+        if hasattr(device, "state"):
+            self.drive = device
+        elif len(self.motors) < MAX_MOTORS:
+            self.motors.append(device)
+            self.names.append(name)
+        return Recorded(device, self, name)
+
+    def sample(self):
+        row = (self.count % self.size) * FIELDS
+        buffer = self.samples
+        buffer[row] = self.watch.time()
+        buffer[row + 1] = self.step
+        if self.drive is not None:
+            distance, speed, angle, turn_rate = self.drive.state()
+            buffer[row + 2] = int(distance)
+            buffer[row + 3] = int(speed)
+            buffer[row + 4] = int(angle * 10)
+            buffer[row + 5] = int(turn_rate)
+        buffer[row + 6] = int(self.hub.imu.heading() * 10)
+        buffer[row + 7] = self.hub.battery.voltage()
+        column = row + len(DRIVE_FIELDS)
+        for motor in self.motors:
+            buffer[column] = motor.angle()
+            buffer[column + 1] = motor.speed()
+            buffer[column + 2] = motor.load()
+            column += len(MOTOR_FIELDS)
+        self.count += 1
+        self.due = buffer[row] + self.period
+
+    def start(self, label):
+        # Tag the samples that follow with a new step.
+        if self.steps < MAX_STEPS:
+            self.step = self.steps
+            self.steps += 1
+            self.starts[self.step] = self.watch.time()
+            self.ends[self.step] = self.starts[self.step]
+            self.labels.append(label)
+        self.sample()
+
+    def end(self):
+        self.sample()
+        if self.step >= 0:
+            self.ends[self.step] = self.watch.time()
+
+    def tick(self):
+        # Take a sample if one is due. Called from every polling loop, see
+        # runtime.poll().
+        if self.watch.time() >= self.due:
+            self.sample()
+
+    def follow(self, device):
+        # Sample until the device completes its move.
+        while not device.done():
+            self.tick()
+            wait(POLL)
+
+    def dump(self):
+        # Print the recording. The host reads it with host/analyze.py.
+        print("telemetry", self.mission, self.period)
+        print("steps", "step,start,end,label")
+        for step in range(self.steps):
+            print("{},{},{},{}".format(
+                step, self.starts[step], self.ends[step], self.labels[step]))
+        columns = list(DRIVE_FIELDS)
+        for name in self.names:
+            columns += [name + "." + field for field in MOTOR_FIELDS]
+        print("samples", ",".join(columns))
+        first = max(0, self.count - self.size)
+        width = len(DRIVE_FIELDS) + len(self.motors) * len(MOTOR_FIELDS)
+        for i in range(first, self.count):
+            row = (i % self.size) * FIELDS
+            print(",".join(str(v) for v in self.samples[row:row + width]))
+        print("end")
+
+
+class Recorded:
+    # Stand-in for a drive base or motor that turns every blocking move into
+    # a recorded step, sampled until the move is done. Moves started with
+    # wait=False are recorded as a step but not followed. Everything else is
+    # passed on to the device.
+
+    def __init__(self, device, recorder, name):
+        self.device = device
+        self.recorder = recorder
+        self.name = name
+
+    def __getattr__(self, name):
+        attribute = getattr(self.device, name)
+        if name not in MOVES:
+            return attribute
+
+        def move(*args, **kwargs):
+            blocking = kwargs.pop("wait", True)
+            recorder = self.recorder
+            recorder.start(self.label(name, args, kwargs))
+            attribute(*args, wait=False, **kwargs)
+            if blocking:
+                recorder.follow(self.device)
+                recorder.end()
+        return move
+
+    def label(self, name, args, kwargs):
+        values = [str(a) for a in args]
+        values += ["{}={}".format(k, v) for k, v in kwargs.items()
+                   if v is not None and k != "then"]
+        return "{}.{}({})".format(self.name, name, ", ".join(values))
+
+    def run_until_stalled(self, *args, **kwargs):
+        # This one has no wait argument, so only its start and end are
+        # sampled.
+        self.recorder.start(self.label("run_until_stalled", args, kwargs))
+        angle = self.device.run_until_stalled(*args, **kwargs)
+        self.recorder.end()
+        return angle
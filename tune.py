@@ -0,0 +1,22 @@
+from pybricks.tools import hub_menu
+
+from programs import programs
+from runtime import drive_base, launch, prime_hub
+from tuning import Tuner
+
+# Tolerances as {mission function: {segment: (mm, degrees)}}, where
+# segments are counted from 0 as in tuned_settings.py. Other segments use
+# tuning.DEFAULT_TOLERANCE. Give None for pushes, pulls and anything else
+# that moves a model, so the tuner does not drive them again and again.
+TOLERANCES = {}
+
+# Choose a program from the menu and tune its segments. Place the robot in
+# base as for a normal launch. Paste the printed entry into
+# tuned_settings.py.
+selected = hub_menu(*programs)
+mission = programs[selected]
+tuner = Tuner(prime_hub, TOLERANCES.get(mission.__name__))
+drive_base.tuner = tuner
+launch(mission)
+drive_base.tuner = None
+tuner.report(mission.__name__)
@@ -0,0 +1,7 @@
+# Drive settings per segment found with tune.py, as
+# {mission function: {segment: (speed, acceleration)}}. Segments are the
+# straight, turn and arc moves of a launch, counted from 0, leaving out
+# the moves of GO_TO and ALIGN steps, which change from run to run. The
+# values are mm/s and mm/s² for straights and arcs, deg/s and deg/s² for
+# turns.
+SETTINGS = {}
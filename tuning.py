@@ -0,0 +1,267 @@
+from math import pi, sin
+
+from pybricks.parameters import Stop
+from pybricks.tools import StopWatch, wait
+
+from tuned_settings import SETTINGS
+
+# Settings tried by the tuner, slowest first: (speed, acceleration) in mm/s
+# and mm/s² for straights and arcs, deg/s and deg/s² for turns.
+STRAIGHT_LEVELS = (
+    (200, 400), (300, 700), (400, 1000), (500, 1500), (600, 2000),
+    (700, 3000), (800, 4000),
+)
+TURN_LEVELS = (
+    (100, 300), (200, 600), (300, 1000), (400, 1500), (500, 2000),
+    (600, 3000),
+)
+# Allowed (distance error in mm, heading error in degrees) per segment,
+# for overshoot past the target, sideways drift and the end of the move.
+DEFAULT_TOLERANCE = (10, 2)
+# Longest time a segment may take to settle within its tolerance after it
+# first gets there.
+SETTLE_TIME = 200
+# How often a segment is sampled while the tuner drives it.
+POLL = 5
+
+
+def apply(drive_base, op, level):
+    speed, acceleration = level
+    if op == "turn":
+        drive_base.settings(turn_rate=speed, turn_acceleration=acceleration)
+    else:
+        drive_base.settings(
+            straight_speed=speed, straight_acceleration=acceleration)
+
+
+def with_level(settings, op, level):
+    # The drive base settings with a level for the given op.
+    speed, acceleration = level
+    if op == "turn":
+        return settings[0], settings[1], speed, acceleration
+    return speed, acceleration, settings[2], settings[3]
+
+
+def move(drive_base, op, args, then=Stop.HOLD, wait=True):
+    if op == "arc":
+        radius, angle, distance = args
+        if distance is None:
+            drive_base.arc(radius, angle=angle, then=then, wait=wait)
+        else:
+            drive_base.arc(radius, distance=distance, then=then, wait=wait)
+    else:
+        getattr(drive_base, op)(args[0], then, wait)
+
+
+def expected(op, args):
+    # Distance driven and heading change of a segment.
+    if op == "straight":
+        return args[0], 0
+    if op == "turn":
+        return 0, args[0]
+    radius, angle, distance = args
+    if distance is None:
+        distance = angle * pi / 180 * abs(radius)
+    return distance, distance / radius * 180 / pi
+
+
+def past(value, target):
+    # How far value went past target, coming from 0. Any move counts when
+    # no move was wanted.
+    if target == 0:
+        return abs(value)
+    if target > 0:
+        return max(0, value - target)
+    return max(0, target - value)
+
+
+def reverse(op, args):
+    if op == "arc":
+        radius, angle, distance = args
+        if distance is None:
+            return radius, -angle, None
+        return radius, None, -distance
+    return (-args[0],)
+
+
+class TunedDriveBase:
+    # Drive base that numbers the straight, turn and arc segments of a
+    # mission and drives each with its settings from tuned_settings.py.
+    # Segments without an entry use the settings the mission chose itself.
+    # Moves of the navigator, see nav.py, are not segments.
+    # With a compensator, see calibration.py, the settings of every segment
+    # are limited to what the motors can do at the moment. Everything else
+    # is passed on to the drive base.
+
+    def __init__(self, drive_base):
+        self.drive_base = drive_base
+        self.tuner = None
+        self.navigator = None
+        self.compensator = None
+        self.table = {}
+        self.segment = 0
+        self.base = drive_base.settings()
+        self.tuned = False
+
+    def __getattr__(self, name):
+        return getattr(self.drive_base, name)
+
+    def begin(self, mission):
+        # Start numbering the segments of a mission from 0.
+        self.table = SETTINGS.get(mission, {})
+        self.segment = 0
+        self.base = self.drive_base.settings()
+        self.tuned = False
+
+    def settings(self, *args, **kwargs):
+        # Without arguments this gives the settings the mission chose, not
+        # the tuned or compensated ones of the last segment.
+        if not args and not kwargs:
+            return self.base
+        if self.tuned:
+            # Settings left out keep the mission's value, not the segment's.
+            self.drive_base.settings(*self.base)
+        self.drive_base.settings(*args, **kwargs)
+        self.base = self.drive_base.settings()
+        self.tuned = False
+
+    def _drive(self, op, args, then, wait):
+        navigator = self.navigator
+        if navigator is not None:
+            # Add the previous move to the position before starting this one.
+            navigator.update()
+            if navigator.driving:
+                # The navigator's moves depend on where the robot really is,
+                # so they are not numbered or tuned.
+                self._move(op, args, then, wait, None)
+                return
+        segment = self.segment
+        self.segment += 1
+        if self.tuner is not None:
+            self.tuner.tune(self, segment, op, args)
+            return
+        self._move(op, args, then, wait, self.table.get(segment))
+
+    def _move(self, op, args, then, wait, level):
+        # Drive with the mission's settings, or a level from the table.
+        if self.compensator is not None:
+            settings = self.base
+            if level is not None:
+                settings = with_level(settings, op, level)
+            settings = self.compensator.limit(settings)
+            if settings != self.drive_base.settings():
+                self.drive_base.settings(*settings)
+            self.tuned = settings != self.base
+            move(self.drive_base, op, args, then, wait)
+            return
+        if level is not None:
+            apply(self.drive_base, op, level)
+            self.tuned = True
+        elif self.tuned:
+            self.drive_base.settings(*self.base)
+            self.tuned = False
+        move(self.drive_base, op, args, then, wait)
+
+    def straight(self, distance, then=Stop.HOLD, wait=True):
+        self._drive("straight", (distance,), then, wait)
+
+    def turn(self, angle, then=Stop.HOLD, wait=True):
+        self._drive("turn", (angle,), then, wait)
+
+    def arc(self, radius, angle=None, distance=None, then=Stop.HOLD,
+            wait=True):
+        self._drive("arc", (radius, angle, distance), then, wait)
+
+
+class Tuner:
+    # Tuning mode. Every segment is driven at faster and faster settings and
+    # driven back after each try. The fastest settings whose overshoot,
+    # sideways drift and settle time, sampled from the encoders and the gyro
+    # during the move, stay within the segment's tolerance are kept, and the
+    # segment is then driven with them so the mission can go on. A tolerance
+    # of None leaves the segment alone, which is needed for pushes and other
+    # moves that change the field.
+
+    def __init__(self, hub, tolerances=None):
+        self.hub = hub
+        self.tolerances = tolerances or {}
+        self.results = {}
+
+    def measure(self, drive_base, op, args, level, tolerance):
+        # Drive a segment at level, sampling it until it is done. After the
+        # move the drive base holds and pulls itself back onto the target,
+        # so the errors are taken while it moves: how far it overshoots the
+        # distance and the heading, how far it drifts sideways, and how
+        # long it takes to settle within tolerance once it first gets
+        # there, or None if it never does.
+        apply(drive_base, op, level)
+        want_distance, want_heading = expected(op, args)
+        start_distance = drive_base.distance()
+        start_heading = self.hub.imu.heading()
+        overshoot = overturn = drift = driven = 0
+        reached = settled = None
+        watch = StopWatch()
+        move(drive_base, op, args, wait=False)
+        while True:
+            done = drive_base.done()
+            distance = drive_base.distance() - start_distance
+            heading = self.hub.imu.heading() - start_heading
+            overshoot = max(overshoot, past(distance, want_distance))
+            overturn = max(overturn, past(heading, want_heading))
+            # The heading should turn evenly along an arc.
+            planned = 0
+            if want_distance:
+                planned = want_heading * distance / want_distance
+            drift += (distance - driven) * sin((heading - planned) * pi / 180)
+            driven = distance
+            if (abs(distance - want_distance) <= tolerance[0]
+                    and abs(heading - want_heading) <= tolerance[1]):
+                if reached is None:
+                    reached = watch.time()
+                if settled is None:
+                    settled = watch.time()
+            else:
+                settled = None
+            if done:
+                break
+            wait(POLL)
+        settle = None if settled is None else settled - reached
+        return overshoot, overturn, abs(drift), settle
+
+    def fits(self, measured, tolerance):
+        overshoot, overturn, drift, settle = measured
+        return (overshoot <= tolerance[0] and drift <= tolerance[0]
+                and overturn <= tolerance[1]
+                and settle is not None and settle <= SETTLE_TIME)
+
+    def tune(self, drive, segment, op, args):
+        drive_base = drive.drive_base
+        tolerance = self.tolerances.get(segment, DEFAULT_TOLERANCE)
+        best = None
+        if tolerance is not None:
+            levels = TURN_LEVELS if op == "turn" else STRAIGHT_LEVELS
+            for level in levels:
+                measured = self.measure(drive_base, op, args, level, tolerance)
+                # Go back slowly for the next try.
+                apply(drive_base, op, levels[0])
+                move(drive_base, op, reverse(op, args))
+                print("segment", segment, op, args, level,
+                      "overshoot {:.1f} mm {:.1f} deg, drift {:.1f} mm, "
+                      "settle {} ms".format(*measured))
+                if not self.fits(measured, tolerance):
+                    break
+                best = level
+        if best is None:
+            drive_base.settings(*drive.base)
+        else:
+            self.results[segment] = best
+            apply(drive_base, op, best)
+        move(drive_base, op, args)
+        drive_base.settings(*drive.base)
+
+    def report(self, mission):
+        # Print the entry to paste into tuned_settings.py.
+        print("    {!r}: {{".format(mission))
+        for segment in sorted(self.results):
+            print("        {}: {},".format(segment, self.results[segment]))
+        print("    },")
@@ -0,0 +1,57 @@
+from pybricks.tools import StopWatch
+
+from runtime import poll
+
+# How often the condition is checked, and how long it must hold before it
+# counts, so a single quiet reading in the middle of a bounce is not enough.
+POLL = 10
+HOLD = 100
+# Below these speeds a motor (deg/s) or the drive base (mm/s and deg/s)
+# counts as still.
+MOTOR_STILL = 20
+DRIVE_STILL = 10
+TURN_STILL = 10
+
+
+def until(condition, timeout, label=""):
+    # Wait until condition() has held for HOLD ms, but no longer than
+    # timeout ms, which is the fixed pause this replaces. Prints how long
+    # the wait took, so the timeouts can be cut down where the condition
+    # always comes early. Returns whether the condition was met.
+    watch = StopWatch()
+    since = None
+    while watch.time() < timeout:
+        if not condition():
+            since = None
+        elif since is None:
+            since = watch.time()
+        elif watch.time() - since >= HOLD:
+            print("wait", label, "met after", since, "ms, saves",
+                  timeout - watch.time(), "of", timeout, "ms")
+            return True
+        poll(POLL)
+    print("wait", label, "timed out after", timeout, "ms")
+    return False
+
+
+def until_done(motor, timeout, label="motor"):
+    # The motor has reached its target, or stalled, and stopped moving.
+    def done():
+        return ((motor.done() or motor.stalled())
+                and abs(motor.speed()) < MOTOR_STILL)
+    return until(done, timeout, label)
+
+
+def until_settled(drive_base, timeout, label="drive base"):
+    # The drive base has completed its move and stopped rocking.
+    def settled():
+        _, speed, _, turn_rate = drive_base.state()
+        return (drive_base.done() and abs(speed) < DRIVE_STILL
+                and abs(turn_rate) < TURN_STILL)
+    return until(settled, timeout, label)
+
+
+def until_still(hub, timeout, label="hub"):
+    # The gyro sees no motion, so the robot and whatever it carries have
+    # stopped swinging.
+    return until(hub.imu.stationary, timeout, label)